@@ -4,8 +4,7 @@ Complete system for PDF extraction, analysis, and courtroom simulation game
 """
 
 import streamlit as st
-import PyPDF2
-from io import BytesIO
+import pypdfium2 as pdfium
 import json
 import os
 from typing import Optional
@@ -247,13 +246,16 @@ def render_sidebar():
 
 def extract_pdf_text(uploaded_file) -> str:
     """Extract text from uploaded PDF."""
-    pdf_reader = PyPDF2.PdfReader(BytesIO(uploaded_file.read()))
-    text = ""
-    for page_num, page in enumerate(pdf_reader.pages, 1):
-        page_text = page.extract_text()
-        if page_text:
-            text += f"\n--- Page {page_num} ---\n{page_text}\n"
-    return text
+    pdf = pdfium.PdfDocument(uploaded_file.read())
+    parts = []
+    try:
+        for page_num, page in enumerate(pdf, 1):
+            page_text = page.get_textpage().get_text_range().replace("\r\n", "\n")
+            if page_text:
+                parts.append(f"\n--- Page {page_num} ---\n{page_text}\n")
+    finally:
+        pdf.close()
+    return "".join(parts)
 
 
 def render_pdf_upload_tab(config):
@@ -1,8 +1,17 @@
+import copy
 import os
+import threading
+from concurrent.futures import Future, TimeoutError as FutureTimeout
+from functools import lru_cache, partial
+from typing import Optional
 from openai import OpenAI
 from dotenv import load_dotenv
+from response_cache import ResponseCache
 from schemas import RoleType, TrialStage, WitnessExamPhase, STAGE_DISPLAY
-from case_data import get_case_info, get_characters, get_evidence_list, get_pw_witnesses, get_dw_witnesses
+from case_data import (
+    get_case_info, get_characters, get_evidence_list, get_pw_witnesses, get_dw_witnesses,
+    get_character_by_role,
+)
 from prompts import (
     JUDGE_SYSTEM_PROMPT,
     PROSECUTOR_SYSTEM_PROMPT,
@@ -11,64 +20,181 @@ from prompts import (
     WITNESS_PW_SYSTEM_PROMPT,
     WITNESS_DW_SYSTEM_PROMPT,
     CLERK_SYSTEM_PROMPT,
+    SUMMARIZER_SYSTEM_PROMPT,
 )
 
 load_dotenv()
 
+MODEL = "gpt-4o"
+MAX_TOKENS = 250
+TEMPERATURE = 0.7
+
+# Most recent conversation messages sent with each request
+HISTORY_WINDOW = 20
+
+
+@lru_cache(maxsize=1)
+def _get_client() -> OpenAI:
+    """One client for all agents, so calls reuse its pooled HTTPS connections."""
+    api_key = os.getenv("openai") or os.getenv("OPENAI_API_KEY")
+    return OpenAI(api_key=api_key)
+
+
+@lru_cache(maxsize=1)
+def _get_response_cache() -> ResponseCache:
+    return ResponseCache()
+
+
+# Replies being generated right now, by response cache key; an identical
+# request made meanwhile waits for that reply instead of sending its own
+_inflight: dict[str, Future] = {}
+_inflight_lock = threading.Lock()
+
+# How long a caller waits on another's identical request before sending its own
+INFLIGHT_WAIT_SECONDS = 60
+
+
+def _claim_inflight(key: str) -> tuple[Future, bool]:
+    """The pending reply for key, and whether this caller must produce it."""
+    with _inflight_lock:
+        pending = _inflight.get(key)
+        if pending is not None:
+            return pending, False
+        pending = _inflight[key] = Future()
+        return pending, True
+
+
+def _release_inflight(key: str, pending: Future, reply: str):
+    with _inflight_lock:
+        del _inflight[key]
+    pending.set_result(reply)
+
+
+class StreamError(str):
+    """Error text yielded as the last chunk of a stream that failed.
+
+    Chunks already yielded before it are a partial reply, so whoever joins
+    the chunks must not cache or remember the result.
+    """
+
 
 class CourtAgent:
-    def __init__(self, character, system_prompt: str):
-        api_key = os.getenv("openai") or os.getenv("OPENAI_API_KEY")
-        self.client = OpenAI(api_key=api_key)
+    def __init__(self, character, system_prompt: str, keep_history: bool = True):
+        self.client = _get_client()
         self.character = character
         self.system_prompt = system_prompt
         self.conversation_history = []
+        self.keep_history = keep_history
 
-    def generate_response(self, context: str, user_input: str = None) -> str:
-        messages = [{"role": "system", "content": self.system_prompt}]
-        for msg in self.conversation_history[-20:]:
-            messages.append(msg)
-
+    def _build_prompt(self, context: str, user_input: str = None) -> str:
         prompt = context
         if user_input:
             prompt += f"\n\nThe player said: \"{user_input}\""
-        prompt += f"\n\nRespond in character as {self.character.name} ({self.character.designation})."
+        prompt += f"\n\nRespond in character as {self.character.prompt_label}."
+        return prompt
 
+    def _build_messages(self, prompt: str, instructions: str = None) -> list[dict]:
+        messages = [{"role": "system", "content": self.system_prompt}]
+        for msg in self.conversation_history[-HISTORY_WINDOW:]:
+            messages.append(msg)
+        # Fixed per-turn instructions go after the history, so the system prompt
+        # and history stay a byte-identical prefix of the agent's previous request
+        if instructions:
+            messages.append({"role": "system", "content": instructions})
         messages.append({"role": "user", "content": prompt})
+        return messages
+
+    def _remember(self, prompt: str, reply: str):
+        if self.keep_history:
+            self.conversation_history.append({"role": "user", "content": prompt})
+            self.conversation_history.append({"role": "assistant", "content": reply})
+
+    def record_reply(self, context: str, user_input: str, reply: str):
+        """Add a reply obtained elsewhere (e.g. the response cache) to this agent's memory."""
+        self._remember(self._build_prompt(context, user_input), reply)
+
+    def snapshot(self) -> "CourtAgent":
+        """A copy with its own copy of the history that remembers nothing, safe to use off the main thread."""
+        clone = copy.copy(self)
+        clone.conversation_history = list(self.conversation_history)
+        clone.keep_history = False
+        return clone
+
+    def generate_response(self, context: str, user_input: str = None, instructions: str = None) -> str:
+        prompt = self._build_prompt(context, user_input)
+        messages = self._build_messages(prompt, instructions)
 
         try:
             response = self.client.chat.completions.create(
-                model="gpt-4o",
+                model=MODEL,
                 messages=messages,
-                max_tokens=250,
-                temperature=0.7,
+                max_tokens=MAX_TOKENS,
+                temperature=TEMPERATURE,
             )
             reply = response.choices[0].message.content.strip()
-            self.conversation_history.append({"role": "user", "content": prompt})
-            self.conversation_history.append({"role": "assistant", "content": reply})
+            self._remember(prompt, reply)
             return reply
         except Exception as e:
             return f"[AI Error: {str(e)}]"
 
+    def stream_response(self, context: str, user_input: str = None, instructions: str = None):
+        """Like generate_response, but yields the reply in chunks as they arrive."""
+        prompt = self._build_prompt(context, user_input)
+        messages = self._build_messages(prompt, instructions)
+
+        parts = []
+        try:
+            stream = self.client.chat.completions.create(
+                model=MODEL,
+                messages=messages,
+                max_tokens=MAX_TOKENS,
+                temperature=TEMPERATURE,
+                stream=True,
+            )
+            for event in stream:
+                if not event.choices:
+                    continue
+                chunk = event.choices[0].delta.content
+                if chunk:
+                    parts.append(chunk)
+                    yield chunk
+        except Exception as e:
+            yield StreamError(f"[AI Error: {str(e)}]")
+            return
+        self._remember(prompt, "".join(parts).strip())
+
+    def warm_prefix(self, context: str, instructions: str = None):
+        """Send a one-token request so the provider caches this prompt's prefix.
+
+        The reply is discarded and nothing is remembered; a later request that
+        starts with the same messages is then billed mostly as cached input.
+        """
+        messages = self._build_messages(self._build_prompt(context), instructions)
+        try:
+            self.client.chat.completions.create(
+                model=MODEL,
+                messages=messages,
+                max_tokens=1,
+                temperature=TEMPERATURE,
+            )
+        except Exception:
+            pass  # warming is best effort; the real request still works without it
+
 
 class AgentManager:
-    def __init__(self, player_role: RoleType):
+    def __init__(self, player_role: RoleType, replay: bool = False):
         self.player_role = player_role
+        # Whether replies are stored and reused across trials
+        self.replay = replay
         self.case_info = get_case_info()
         self.characters = get_characters()
         self.evidence = get_evidence_list()
         self.pw_witnesses = get_pw_witnesses()
         self.dw_witnesses = get_dw_witnesses()
         self.agents: dict[str, CourtAgent] = {}
+        self.cache = _get_response_cache()
         self._create_agents()
 
-    def _get_char(self, role: RoleType, designation: str = None):
-        for c in self.characters:
-            if c.role == role:
-                if designation is None or c.designation == designation:
-                    return c
-        return None
-
     def _format_witness_list(self) -> str:
         lines = []
         for w in self.pw_witnesses:
@@ -86,7 +212,7 @@ class AgentManager:
         stage_str = "Trial beginning"
 
         # Judge
-        judge_char = self._get_char(RoleType.JUDGE)
+        judge_char = get_character_by_role(RoleType.JUDGE)
         if judge_char:
             prompt = JUDGE_SYSTEM_PROMPT.format(
                 name=judge_char.name,
@@ -102,7 +228,7 @@ class AgentManager:
             self.agents["judge"] = CourtAgent(judge_char, prompt)
 
         # Prosecutor
-        pp_char = self._get_char(RoleType.PROSECUTOR)
+        pp_char = get_character_by_role(RoleType.PROSECUTOR)
         if pp_char:
             prompt = PROSECUTOR_SYSTEM_PROMPT.format(
                 name=pp_char.name,
@@ -121,8 +247,8 @@ class AgentManager:
             self.agents["prosecutor"] = CourtAgent(pp_char, prompt)
 
         # Defence
-        def_char = self._get_char(RoleType.DEFENCE)
-        accused_char = self._get_char(RoleType.ACCUSED)
+        def_char = get_character_by_role(RoleType.DEFENCE)
+        accused_char = get_character_by_role(RoleType.ACCUSED)
         if def_char:
             prompt = DEFENCE_SYSTEM_PROMPT.format(
                 name=def_char.name,
@@ -176,7 +302,7 @@ class AgentManager:
             self.agents[f"dw_{i}"] = CourtAgent(dw, prompt)
 
         # Clerk
-        clerk_char = self._get_char(RoleType.CLERK)
+        clerk_char = get_character_by_role(RoleType.CLERK)
         if clerk_char:
             prompt = CLERK_SYSTEM_PROMPT.format(
                 court=case.court,
@@ -186,11 +312,149 @@ class AgentManager:
             )
             self.agents["clerk"] = CourtAgent(clerk_char, prompt)
 
-    def get_response(self, agent_key: str, context: str, user_input: str = None) -> str:
+            # Record summarizer: stateless, each request carries its own text
+            prompt = SUMMARIZER_SYSTEM_PROMPT.format(
+                court=case.court,
+                case_title=case.title,
+                case_number=case.case_number,
+            )
+            self.agents["summarizer"] = CourtAgent(clerk_char, prompt, keep_history=False)
+
+    def get_response(
+        self, agent_key: str, context: str, user_input: str = None, instructions: str = None,
+        bypass_cache: bool = False,
+    ) -> str:
+        """Agent reply, from the response cache when replaying unless bypass_cache asks for a fresh one."""
         agent = self.agents.get(agent_key)
         if not agent:
             return "[Agent not found]"
-        return agent.generate_response(context, user_input)
+        return self._respond(agent, agent_key, context, user_input, instructions, bypass_cache)
+
+    def response_task(
+        self, agent_key: str, context: str, user_input: str = None, instructions: str = None,
+        bypass_cache: bool = False,
+    ):
+        """A zero-argument callable that produces this reply on a worker thread.
+
+        It works on a snapshot of the agent taken now, so it neither reads nor
+        extends the live history. The caller records the reply if it uses it.
+        """
+        agent = self.agents.get(agent_key)
+        if not agent:
+            return lambda: "[Agent not found]"
+        return partial(
+            self._respond, agent.snapshot(), agent_key, context, user_input, instructions, bypass_cache,
+        )
+
+    def _respond(
+        self, agent: CourtAgent, agent_key: str, context: str, user_input: str, instructions: str,
+        bypass_cache: bool,
+    ) -> str:
+        key = self._cache_key(agent, agent_key, context, user_input, instructions)
+        cached, pending = (None, None) if bypass_cache else self._lookup(key)
+        if cached is not None:
+            # Keep the agent's memory as if it had answered itself
+            if not cached.startswith("[AI Error"):
+                agent.record_reply(context, user_input, cached)
+            return cached
+        reply = "[AI Error: request abandoned]"
+        try:
+            reply = agent.generate_response(context, user_input, instructions)
+            if self.replay and not reply.startswith("[AI Error"):
+                self.cache.set(key, reply)
+        finally:
+            if pending is not None:
+                _release_inflight(key, pending, reply)
+        return reply
+
+    def stream_response(
+        self, agent_key: str, context: str, user_input: str = None, instructions: str = None,
+        bypass_cache: bool = False,
+    ):
+        agent = self.agents.get(agent_key)
+        if not agent:
+            yield StreamError("[Agent not found]")
+            return
+        key = self._cache_key(agent, agent_key, context, user_input, instructions)
+        # No in-flight sharing here: a stream the caller stops reading would
+        # hold the claim, and every identical request would wait on it
+        cached = self.cache.get(key) if self.replay and not bypass_cache else None
+        if cached is not None:
+            if not cached.startswith("[AI Error"):
+                agent.record_reply(context, user_input, cached)
+            yield cached
+            return
+        parts = []
+        failed = False
+        for chunk in agent.stream_response(context, user_input, instructions):
+            failed = failed or isinstance(chunk, StreamError)
+            parts.append(chunk)
+            yield chunk
+        if self.replay and not failed:
+            self.cache.set(key, "".join(parts).strip())
+
+    def _lookup(self, key: str) -> tuple[str, Future]:
+        """A stored or in-flight reply for key, else a claim on producing it.
+
+        Returns (reply, None) when the reply is already available, or
+        (None, future) when the caller must generate it and then release the
+        future, so identical requests from other sessions or threads share
+        one API call. (None, None) means the wait on another caller timed
+        out and this caller should generate the reply unshared. Stored
+        replies are only read when replaying; in-flight ones are always shared.
+        """
+        cached = self.cache.get(key) if self.replay else None
+        if cached is not None:
+            return cached, None
+        pending, leading = _claim_inflight(key)
+        if not leading:
+            try:
+                return pending.result(timeout=INFLIGHT_WAIT_SECONDS), None
+            except FutureTimeout:
+                return None, None
+        # Another caller may have stored the reply between the miss and the claim
+        cached = self.cache.get(key) if self.replay else None
+        if cached is not None:
+            _release_inflight(key, pending, cached)
+            return cached, None
+        return None, pending
+
+    def record_reply(self, agent_key: str, context: str, user_input: str, reply: str):
+        """Add a reply the caller already had to the agent's memory, as if it had just answered."""
+        agent = self.agents.get(agent_key)
+        if agent:
+            agent.record_reply(context, user_input, reply)
+
+    def warm_task(self, agent_key: str, context: str, instructions: str = None):
+        """A zero-argument callable that warms this prompt's prefix on a worker thread, from a snapshot taken now."""
+        agent = self.agents.get(agent_key)
+        if not agent:
+            return lambda: None
+        return partial(agent.snapshot().warm_prefix, context, instructions)
+
+    def reply_key(
+        self, agent_key: str, context: str, user_input: str = None, instructions: str = None,
+    ) -> Optional[str]:
+        """The response cache key for this request as the agent stands now, or None if there is no such agent."""
+        agent = self.agents.get(agent_key)
+        if not agent:
+            return None
+        return self._cache_key(agent, agent_key, context, user_input, instructions)
+
+    def _cache_key(
+        self, agent: CourtAgent, agent_key: str, context: str, user_input: str = None, instructions: str = None,
+    ) -> str:
+        # Model settings and the agent's system prompt are part of the key, so
+        # editing either invalidates replies generated under the old ones. The
+        # player's role fixes which roles are AI, and the history digest ties a
+        # reply to the conversation it was generated in.
+        history = ResponseCache.make_key(*(
+            f"{msg['role']}:{msg['content']}" for msg in agent.conversation_history[-HISTORY_WINDOW:]
+        ))
+        return ResponseCache.make_key(
+            MODEL, str(TEMPERATURE), str(MAX_TOKENS), agent.system_prompt, self.player_role.value,
+            history, agent_key, instructions or "", context, user_input or "",
+        )
 
     def get_agent_key_for_role(self, role: RoleType, index: int = 0) -> str:
         mapping = {
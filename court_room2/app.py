@@ -1,9 +1,9 @@
 import streamlit as st
 from schemas import (
-    RoleType, TrialStage, WitnessExamPhase,
-    STAGE_DISPLAY, STAGE_ORDER,
+    RoleType, TrialStage, WitnessExamPhase, ChargeStep,
+    STAGE_DISPLAY, STAGE_ORDER, STAGE_INDEX, NEXT_STAGE,
 )
-from case_data import get_case_info, get_characters, get_evidence_list, get_pw_witnesses, get_dw_witnesses
+from case_data import get_case_info, get_evidence_list, get_pw_witnesses, get_dw_witnesses, get_character_by_role
 from game_engine import TrialEngine
 
 # ─── PAGE CONFIG ─────────────────────────────────────────────
@@ -155,16 +155,41 @@ def render_dialogues():
     if not engine:
         return
     for d in engine.state.dialogues:
-        box_cls, name_cls = get_dialogue_class(d.role, d.is_player)
-        label = f"🎯 YOU ({d.speaker})" if d.is_player else d.speaker
-        role_badge = d.role.value
-        st.markdown(
-            f'<div class="{box_cls}">'
-            f'<div class="{name_cls}">{label} — <em>{role_badge}</em></div>'
-            f'<div>{d.text}</div>'
-            f'</div>',
-            unsafe_allow_html=True,
-        )
+        st.markdown(dialogue_html(d.speaker, d.role, d.text, d.is_player), unsafe_allow_html=True)
+
+
+def dialogue_html(speaker: str, role: RoleType, text: str, is_player: bool = False) -> str:
+    box_cls, name_cls = get_dialogue_class(role, is_player)
+    label = f"🎯 YOU ({speaker})" if is_player else speaker
+    return (
+        f'<div class="{box_cls}">'
+        f'<div class="{name_cls}">{label} — <em>{role.value}</em></div>'
+        f'<div>{text}</div>'
+        f'</div>'
+    )
+
+
+class LiveDialogue:
+    """Renders streamed speech as it arrives, one box per consecutive speaker.
+
+    The rerun that follows each stream redraws everything from the dialogue log.
+    """
+
+    def __init__(self):
+        self.speaker, self.box, self.text = None, None, ""
+
+    def __call__(self, char, chunk: str):
+        if char is not self.speaker:
+            self.speaker, self.box, self.text = char, st.empty(), ""
+        self.text += chunk
+        self.box.markdown(dialogue_html(char.name, char.role, self.text), unsafe_allow_html=True)
+
+
+def stream_exchange(chunks):
+    """Render an AI Q&A live as it streams."""
+    live = LiveDialogue()
+    for _tag, char, chunk in chunks:
+        live(char, chunk)
 
 
 STAGE_SHORT_LABELS = {
@@ -184,7 +209,7 @@ def render_stage_progress():
     engine = st.session_state.engine
     if not engine:
         return
-    current_idx = STAGE_ORDER.index(engine.state.current_stage)
+    current_idx = STAGE_INDEX[engine.state.current_stage]
     cols = st.columns(9)
     for i, stage in enumerate(STAGE_ORDER):
         with cols[i]:
@@ -247,7 +272,6 @@ def role_select_screen():
     st.markdown("Select the courtroom role you want to play. All other roles will be AI-controlled.")
     st.markdown("---")
 
-    characters = get_characters()
     roles = [
         (RoleType.JUDGE, "⚖️", "Judge", "Preside over the trial, frame charges, examine the accused, and deliver the verdict."),
         (RoleType.PROSECUTOR, "🔴", "Public Prosecutor", "Represent the State. Examine prosecution witnesses, present evidence, and argue guilt."),
@@ -255,21 +279,22 @@ def role_select_screen():
         (RoleType.ACCUSED, "👤", "Accused", "You are Rajesh Kumar Sharma. Maintain your innocence and respond to the Judge's questions."),
     ]
 
+    replay = st.checkbox(
+        "Replay AI replies saved from earlier playthroughs",
+        key="replay_trial",
+    )
+
     cols = st.columns(2)
     for i, (role, icon, title, desc) in enumerate(roles):
         with cols[i % 2]:
-            char = None
-            for c in characters:
-                if c.role == role:
-                    char = c
-                    break
+            char = get_character_by_role(role)
             st.markdown(f"### {icon} {title}")
             if char:
                 st.markdown(f"**Character:** {char.name}")
             st.markdown(desc)
             if st.button(f"Play as {title}", key=f"role_{role.value}", use_container_width=True):
                 st.session_state.player_role = role
-                st.session_state.engine = TrialEngine(role)
+                st.session_state.engine = TrialEngine(role, replay=replay)
                 st.session_state.screen = "trial"
                 st.session_state.stage_auto_run = False
                 st.session_state.exam_question_count = 0
@@ -344,14 +369,17 @@ def trial_screen():
 
     stage = engine.state.current_stage
 
-    # Auto-run stage logic if not yet run
+    # Auto-run stage logic if not yet run, streaming long speeches below the
+    # dialogue so far, then rerun to draw the finished record
     if not st.session_state.stage_auto_run:
-        stage_done = run_current_stage(engine, stage)
+        render_dialogues()
+        engine.stream_sink = LiveDialogue()
+        try:
+            engine.step()
+        finally:
+            engine.stream_sink = None
         st.session_state.stage_auto_run = True
-        if stage_done and not engine.state.waiting_for_player:
-            # Auto-advance for quick stages
-            if stage in [TrialStage.PRE_TRIAL, TrialStage.COGNIZANCE, TrialStage.PROSECUTION_OPENING]:
-                pass  # Will show "Continue" button
+        st.rerun()
 
     # Render all dialogue so far
     render_dialogues()
@@ -372,29 +400,6 @@ def trial_screen():
         render_continue_controls(engine, stage)
 
 
-def run_current_stage(engine, stage):
-    """Run the current stage logic and return True if stage is complete."""
-    if stage == TrialStage.PRE_TRIAL:
-        return engine.run_pre_trial()
-    elif stage == TrialStage.COGNIZANCE:
-        return engine.run_cognizance()
-    elif stage == TrialStage.CHARGE:
-        return engine.run_charge_stage()
-    elif stage == TrialStage.PROSECUTION_OPENING:
-        return engine.run_prosecution_opening()
-    elif stage == TrialStage.WITNESS_EXAMINATION:
-        return engine.run_witness_examination()
-    elif stage == TrialStage.ACCUSED_STATEMENT:
-        return engine.run_accused_statement()
-    elif stage == TrialStage.DEFENCE_EVIDENCE:
-        return engine.run_defence_evidence()
-    elif stage == TrialStage.FINAL_ARGUMENTS:
-        return engine.run_final_arguments()
-    elif stage == TrialStage.JUDGMENT:
-        return engine.run_judgment()
-    return False
-
-
 def render_player_input(engine, stage):
     """Render the player input area based on current stage."""
     st.markdown("---")
@@ -408,13 +413,13 @@ def render_player_input(engine, stage):
             st.info("📢 **Your turn (Defence Counsel):** Confirm receipt of documents.")
 
     elif stage == TrialStage.CHARGE:
-        if player_role == RoleType.PROSECUTOR and engine.state.sub_step == 0:
+        if player_role == RoleType.PROSECUTOR and engine.state.sub_step == ChargeStep.PROSECUTION_ARGUES:
             st.info("📢 **Your turn (Public Prosecutor):** Argue why charges should be framed.")
-        elif player_role == RoleType.DEFENCE and engine.state.sub_step == 1:
+        elif player_role == RoleType.DEFENCE and engine.state.sub_step == ChargeStep.DEFENCE_ARGUES:
             st.info("📢 **Your turn (Defence Counsel):** Argue for discharge of the accused.")
-        elif player_role == RoleType.JUDGE and engine.state.sub_step == 10:
+        elif player_role == RoleType.JUDGE and engine.state.sub_step == ChargeStep.JUDGE_FRAMES:
             st.info("📢 **Your turn (Judge):** Frame charges and ask the accused to plead.")
-        elif player_role == RoleType.ACCUSED and engine.state.sub_step == 20:
+        elif player_role == RoleType.ACCUSED and engine.state.sub_step == ChargeStep.ACCUSED_PLEADS:
             st.info("📢 **Your turn (Accused):** Enter your plea (guilty / not guilty).")
 
     elif stage == TrialStage.PROSECUTION_OPENING:
@@ -490,24 +495,9 @@ def render_player_input(engine, stage):
 
 def handle_player_submit(engine, stage, player_input):
     """Route player input to the correct handler."""
-    if stage == TrialStage.COGNIZANCE:
-        engine.handle_cognizance_input(player_input)
-    elif stage == TrialStage.CHARGE:
-        engine.handle_charge_input(player_input)
-    elif stage == TrialStage.PROSECUTION_OPENING:
-        engine.handle_prosecution_opening_input(player_input)
-    elif stage == TrialStage.WITNESS_EXAMINATION:
-        engine.handle_witness_exam_input(player_input)
-        st.session_state.exam_question_count += 1
-    elif stage == TrialStage.ACCUSED_STATEMENT:
-        engine.handle_accused_statement_input(player_input)
-    elif stage == TrialStage.DEFENCE_EVIDENCE:
-        engine.handle_dw_exam_input(player_input)
+    engine.handle_input(player_input)
+    if stage in (TrialStage.WITNESS_EXAMINATION, TrialStage.DEFENCE_EVIDENCE):
         st.session_state.exam_question_count += 1
-    elif stage == TrialStage.FINAL_ARGUMENTS:
-        engine.handle_final_args_input(player_input)
-    elif stage == TrialStage.JUDGMENT:
-        engine.handle_judgment_input(player_input)
 
 
 def render_continue_controls(engine, stage):
@@ -528,7 +518,10 @@ def render_continue_controls(engine, stage):
                 col1, col2 = st.columns(2)
                 with col1:
                     if st.button(f"▶️ Next Q&A ({phase.value})", use_container_width=True, key="auto_qa"):
-                        engine.auto_witness_exchange()
+                        stream_exchange(engine.auto_witness_exchange())
+                        if not engine.state.stage_initialized:
+                            # Re-examination was waived; call the next witness
+                            st.session_state.stage_auto_run = False
                         st.rerun()
                 with col2:
                     if st.button(f"⏭️ End {phase.value}", use_container_width=True, key="end_phase"):
@@ -556,7 +549,10 @@ def render_continue_controls(engine, stage):
                 col1, col2 = st.columns(2)
                 with col1:
                     if st.button(f"▶️ Next Q&A ({phase.value})", use_container_width=True, key="auto_dw_qa"):
-                        engine.auto_dw_exchange()
+                        stream_exchange(engine.auto_dw_exchange())
+                        if not engine.state.stage_initialized:
+                            # Re-examination was waived; call the next witness
+                            st.session_state.stage_auto_run = False
                         st.rerun()
                 with col2:
                     if st.button(f"⏭️ End {phase.value}", use_container_width=True, key="end_dw_phase"):
@@ -573,9 +569,8 @@ def render_continue_controls(engine, stage):
             return
 
     # Generic "Next Stage" button
-    current_idx = STAGE_ORDER.index(stage)
-    if current_idx < len(STAGE_ORDER) - 1:
-        next_stage = STAGE_DISPLAY[STAGE_ORDER[current_idx + 1]]
+    if stage in NEXT_STAGE:
+        next_stage = STAGE_DISPLAY[NEXT_STAGE[stage]]
         if st.button(f"➡️ Proceed to {next_stage}", type="primary", use_container_width=True):
             engine.advance_stage()
             st.session_state.stage_auto_run = False
@@ -0,0 +1,26 @@
+from schemas import RoleType
+
+# Case-independent records shared by every case data module. A case module
+# takes these as they are, or spreads a template and adds only the fields
+# specific to its own case, so the common text is defined in one place.
+
+COMMON_CHARACTER_TEMPLATES = {
+    "clerk": dict(
+        name="Court Clerk",
+        role=RoleType.CLERK,
+        designation="Court Clerk",
+        description="Court administrative officer responsible for calling cases and recording proceedings.",
+        personality="Procedural, formal, announces cases and stages clearly.",
+        facts_known="Knows the case number, parties, and procedural requirements.",
+    ),
+}
+
+COMMON_EVIDENCE_TEMPLATES = {
+    "fir": dict(name="First Information Report (FIR)", evidence_type="documentary", presented_by="prosecution"),
+    "post_mortem": dict(name="Post-Mortem Report", evidence_type="documentary", presented_by="prosecution"),
+    "cctv": dict(name="CCTV Footage", evidence_type="documentary", presented_by="prosecution"),
+    "forensic": dict(name="Forensic Analysis Report", evidence_type="documentary", presented_by="prosecution"),
+    "panchnama": dict(name="Scene of Crime Panchnama", evidence_type="documentary", presented_by="prosecution"),
+    "accused_medical": dict(name="Medical Report of Accused", evidence_type="documentary", presented_by="defence"),
+    "call_records": dict(name="Phone Call Records", evidence_type="documentary", presented_by="defence"),
+}
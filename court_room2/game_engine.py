@@ -1,58 +1,304 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional
+
 from schemas import (
-    TrialStage, RoleType, WitnessExamPhase, Dialogue,
-    GameState, STAGE_ORDER, STAGE_DISPLAY, EvidenceStatus,
+    TrialStage, RoleType, WitnessExamPhase, ChargeStep, Dialogue,
+    GameState, NEXT_STAGE, STAGE_DISPLAY, EvidenceStatus,
+)
+from case_data import get_case_bundle, get_pw_witnesses, get_dw_witnesses
+from agents import AgentManager, StreamError
+from prompts import (
+    WITNESS_CONTEXT_PREFIX,
+    PW_ANSWER_CONTEXT,
+    DW_ANSWER_CONTEXT,
+    PW_CHIEF_CONTEXT,
+    PW_CROSS_CONTEXT,
+    PW_RE_EXAM_CONTEXT,
+    DW_CHIEF_CONTEXT,
+    DW_CROSS_CONTEXT,
+    DW_RE_EXAM_CONTEXT,
+    PROSECUTOR_CLOSING_INSTRUCTIONS,
+    DEFENCE_CLOSING_INSTRUCTIONS,
+    JUDGE_VERDICT_INSTRUCTIONS,
+    CLOSING_CONTEXT,
+    VERDICT_CONTEXT,
 )
-from case_data import get_case_info, get_pw_witnesses, get_dw_witnesses, get_evidence_list, get_characters
-from agents import AgentManager
+
+# Rough size of a token in English text, used to budget prompt records
+CHARS_PER_TOKEN = 4
+
+# Token budgets for the trial record sent with the closings and the verdict
+CLOSING_RECORD_TOKENS = 2000
+VERDICT_RECORD_TOKENS = 4000
+
+# Background generation of replies whose prompt is already fully known, shared
+# by every session; workers only ever see snapshots of the agents
+_PREFETCH_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="court-prefetch")
+
+# Player input containing this makes the AI reply it leads to skip the response caches
+RECACHE_COMMAND = "!recache"
+
+# Raw transcript lines kept per witness before older ones are summarized
+TESTIMONY_RECENT_LINES = 6
+
+# Fixed courtroom lines, shared by every dialogue that speaks them
+_CANNED = {
+    "APPEARANCES": "Appearances?",
+    "PP_APPEARANCE": "Learned Public Prosecutor for the State, My Lord.",
+    "DEFENCE_APPEARANCE": "Counsel for the accused, My Lord.",
+    "SUPPLY_QUERY": "Have copies under Section 207 CrPC been supplied to the accused?",
+    "DOCUMENTS_SUPPLIED": "Yes, My Lord. All documents have been supplied.",
+    "RECEIVED": "Received, My Lord.",
+    "CHARGE_ARGUMENTS": "Arguments on charge.",
+    "NOT_GUILTY": "I plead not guilty and claim trial, My Lord.",
+    "PW_CLOSED": "My Lord, prosecution evidence is closed.",
+    "PW_CROSS": "Defence, you may cross-examine the witness.",
+    "PW_RE_EXAM": "Prosecution, any re-examination?",
+    "NO_DEFENCE_EVIDENCE": "The defence does not wish to lead any evidence, My Lord.",
+    "DW_CLOSED": "Defence evidence is closed, My Lord.",
+    "DW_CROSS": "Prosecution, you may cross-examine.",
+    "DW_RE_EXAM": "Defence, any re-examination?",
+    "FINAL_ARGS_OPEN": "The Court will now hear final arguments. Prosecution may begin.",
+    "DEFENCE_FINAL_ARGS": "Defence, your final arguments.",
+    "NO_RE_EXAM": "No re-examination, My Lord.",
+}
+
+# (agent key, role) of the examiner in each phase of a PW / DW examination
+_PW_EXAMINER = {
+    WitnessExamPhase.CHIEF: ("prosecutor", RoleType.PROSECUTOR),
+    WitnessExamPhase.CROSS: ("defence", RoleType.DEFENCE),
+    WitnessExamPhase.RE_EXAMINATION: ("prosecutor", RoleType.PROSECUTOR),
+}
+_DW_EXAMINER = {
+    WitnessExamPhase.CHIEF: ("defence", RoleType.DEFENCE),
+    WitnessExamPhase.CROSS: ("prosecutor", RoleType.PROSECUTOR),
+    WitnessExamPhase.RE_EXAMINATION: ("defence", RoleType.DEFENCE),
+}
+
+# Phase that follows each exam phase and the judge's line opening it; after
+# re-examination the next witness is called
+_PW_PHASE_ADVANCE = {
+    WitnessExamPhase.CHIEF: (WitnessExamPhase.CROSS, _CANNED["PW_CROSS"]),
+    WitnessExamPhase.CROSS: (WitnessExamPhase.RE_EXAMINATION, _CANNED["PW_RE_EXAM"]),
+}
+_DW_PHASE_ADVANCE = {
+    WitnessExamPhase.CHIEF: (WitnessExamPhase.CROSS, _CANNED["DW_CROSS"]),
+    WitnessExamPhase.CROSS: (WitnessExamPhase.RE_EXAMINATION, _CANNED["DW_RE_EXAM"]),
+}
 
 
 class TrialEngine:
-    def __init__(self, player_role: RoleType):
+    def __init__(self, player_role: RoleType, replay: bool = False):
         self.state = GameState(player_role=player_role)
-        self.case_info = get_case_info()
+        # Fixed for the engine's lifetime; a new role means a new TrialEngine
+        self._player_role = player_role
+        self.case_info, self.characters, self.state.evidence_list = get_case_bundle()
         self.pw_witnesses = get_pw_witnesses()
         self.dw_witnesses = get_dw_witnesses()
-        self.state.evidence_list = get_evidence_list()
-        self.characters = get_characters()
-        self.agents = AgentManager(player_role)
+        # handle_charge_input: what follows the player's turn at each charge sub_step
+        self._charge_dispatch = {
+            ChargeStep.PROSECUTION_ARGUES: self._charge_after_pp_player,
+            ChargeStep.DEFENCE_ARGUES: self._charge_after_def_player,
+            ChargeStep.JUDGE_FRAMES: self._charge_after_judge_player,
+            ChargeStep.ACCUSED_PLEADS: self._charge_after_accused_player,
+        }
+        # Stage -> its run_* processor and its handle_*_input player handler
+        self._run_table = {
+            TrialStage.PRE_TRIAL: self.run_pre_trial,
+            TrialStage.COGNIZANCE: self.run_cognizance,
+            TrialStage.CHARGE: self.run_charge_stage,
+            TrialStage.PROSECUTION_OPENING: self.run_prosecution_opening,
+            TrialStage.WITNESS_EXAMINATION: self.run_witness_examination,
+            TrialStage.ACCUSED_STATEMENT: self.run_accused_statement,
+            TrialStage.DEFENCE_EVIDENCE: self.run_defence_evidence,
+            TrialStage.FINAL_ARGUMENTS: self.run_final_arguments,
+            TrialStage.JUDGMENT: self.run_judgment,
+        }
+        self._handle_table = {
+            TrialStage.COGNIZANCE: self.handle_cognizance_input,
+            TrialStage.CHARGE: self.handle_charge_input,
+            TrialStage.PROSECUTION_OPENING: self.handle_prosecution_opening_input,
+            TrialStage.WITNESS_EXAMINATION: self.handle_witness_exam_input,
+            TrialStage.ACCUSED_STATEMENT: self.handle_accused_statement_input,
+            TrialStage.DEFENCE_EVIDENCE: self.handle_dw_exam_input,
+            TrialStage.FINAL_ARGUMENTS: self.handle_final_args_input,
+            TrialStage.JUDGMENT: self.handle_judgment_input,
+        }
+        self._sections_csv = ", ".join(self.case_info.sections)
+        self._pw_designations_csv = ", ".join(w.designation for w in self.pw_witnesses)
+        self.agents = AgentManager(player_role, replay=replay)
+        # First character per role, matching the old linear scan's order.
+        self._char_by_role = {}
+        for c in self.characters:
+            self._char_by_role.setdefault(c.role, c)
+        # The five court officers speak in nearly every stage
+        self.judge = self._char_by_role[RoleType.JUDGE]
+        self.pp = self._char_by_role[RoleType.PROSECUTOR]
+        self.defence = self._char_by_role[RoleType.DEFENCE]
+        self.clerk = self._char_by_role[RoleType.CLERK]
+        self.accused = self._char_by_role[RoleType.ACCUSED]
+        self._player_char = self._char_by_role.get(player_role)
+        self._resp_cache: dict[str, str] = {}
+        # Optional callable(character, chunk) fed while a closing or the verdict
+        # streams in; set by the UI around a stage run
+        self.stream_sink = None
+        # (context, future) of a verdict started before run_judgment asked for it,
+        # generated from a snapshot of the judge without touching its memory
+        self._speculative_verdict = None
+        # Set by RECACHE_COMMAND in a handler that then asks for a reply; the
+        # next agent call skips the caches and clears it
+        self._bypass_cache = False
+        # Prompt-formatted transcript, one line per dialogue, and each line's
+        # estimated token cost, kept by add_dialogue. Every line is kept: a
+        # token budget can reach back over any number of short lines.
+        self._recent_lines: list[str] = []
+        self._recent_tokens: list[int] = []
+        # get_recent_context results by n, valid until the next add_dialogue
+        self._context_cache: dict[tuple, str] = {}
+        # Rendered testimony per (is_dw, witness index), extended as lines are recorded
+        self._testimony_text: dict[tuple[bool, int], str] = {}
+        # Summaries being written in the background, as (lines folded, future)
+        self._pending_summaries: dict[tuple[bool, int], tuple[tuple[str, ...], Future]] = {}
+        # Invariant head of each witness's answer context. Prior testimony and
+        # the question follow it, so successive prompts share a byte-identical
+        # prefix that provider-side prompt caching can reuse.
+        self._witness_prefix = [self._witness_context_prefix(w) for w in self.pw_witnesses]
+        self._dw_prefix = [self._witness_context_prefix(w) for w in self.dw_witnesses]
 
     def add_dialogue(self, speaker: str, role: RoleType, text: str, is_player: bool = False):
-        d = Dialogue(
-            speaker=speaker,
-            role=role,
-            text=text,
-            stage=self.state.current_stage,
-            is_player=is_player,
-        )
-        self.state.dialogues.append(d)
-        return d
+        return self._add_many([(speaker, role, text)], is_player)[0]
+
+    def _record_player(self, text: str) -> Dialogue:
+        """Record a line the player spoke in their own role."""
+        return self.add_dialogue(self._player_char.name, self._player_role, text, is_player=True)
+
+    def _add_many(self, specs, is_player: bool = False) -> list[Dialogue]:
+        """Record consecutive lines, given as (speaker, role, text), in one go."""
+        stage = self.state.current_stage
+        added = [
+            Dialogue(speaker=speaker, role=role, text=text, stage=stage, is_player=is_player)
+            for speaker, role, text in specs
+        ]
+        self.state.dialogues.extend(added)
+        lines = [f"{speaker} ({role.value}): {text}" for speaker, role, text in specs]
+        self._recent_lines.extend(lines)
+        self._recent_tokens.extend(len(line) // CHARS_PER_TOKEN + 1 for line in lines)
+        self._context_cache.clear()
+        return added
+
+    def _cached_response(
+        self, agent_key: str, context: str, user_input: str = None, instructions: str = None,
+    ) -> str:
+        """Agent reply for an exact (agent and its history, instructions, context, input), asked at most once."""
+        h = self.agents.reply_key(agent_key, context, user_input, instructions)
+        bypass, self._bypass_cache = self._bypass_cache, False
+        cached = None if bypass else self._resp_cache.get(h)
+        if cached is not None:
+            self.agents.record_reply(agent_key, context, user_input, cached)
+            return cached
+        reply = self.agents.get_response(agent_key, context, user_input, instructions, bypass_cache=bypass)
+        if not reply.startswith("[AI Error"):
+            self._resp_cache[h] = reply
+        return reply
+
+    def _stream_response(
+        self, agent_key: str, context: str, user_input: str = None, instructions: str = None,
+    ):
+        """Yield an agent reply in chunks, sharing the cache with _cached_response."""
+        h = self.agents.reply_key(agent_key, context, user_input, instructions)
+        bypass, self._bypass_cache = self._bypass_cache, False
+        cached = None if bypass else self._resp_cache.get(h)
+        if cached is not None:
+            self.agents.record_reply(agent_key, context, user_input, cached)
+            yield cached
+            return
+        parts = []
+        failed = False
+        for chunk in self.agents.stream_response(
+            agent_key, context, user_input, instructions, bypass_cache=bypass,
+        ):
+            failed = failed or isinstance(chunk, StreamError)
+            parts.append(chunk)
+            yield chunk
+        if not failed:
+            self._resp_cache[h] = "".join(parts).strip()
+
+    def _stream_turn(self, tag: str, char, agent_key: str, context: str, user_input: str = None):
+        """Stream one speaker's turn as (tag, character, chunk); the full text is the return value."""
+        parts = []
+        for chunk in self._stream_response(agent_key, context, user_input):
+            parts.append(chunk)
+            yield tag, char, chunk
+        return "".join(parts).strip()
+
+    def _streamed_response(self, char, agent_key: str, context: str, instructions: str = None) -> str:
+        """Agent reply, passed chunk by chunk to stream_sink (if any) as it arrives."""
+        parts = []
+        for chunk in self._stream_response(agent_key, context, None, instructions):
+            parts.append(chunk)
+            if self.stream_sink:
+                self.stream_sink(char, chunk)
+        return "".join(parts).strip()
+
+    @staticmethod
+    def _split_recache_command(player_input: str) -> tuple[str, bool]:
+        """Player input without RECACHE_COMMAND, and whether the command was there."""
+        if RECACHE_COMMAND in player_input:
+            return player_input.replace(RECACHE_COMMAND, "").strip(), True
+        return player_input, False
 
     def get_character_by_role(self, role: RoleType):
-        for c in self.characters:
-            if c.role == role:
-                return c
-        return None
+        return self._char_by_role.get(role)
 
     def is_player(self, role: RoleType) -> bool:
-        return role == self.state.player_role
+        return role == self._player_role
 
     def advance_stage(self):
-        idx = STAGE_ORDER.index(self.state.current_stage)
-        if idx < len(STAGE_ORDER) - 1:
-            self.state.current_stage = STAGE_ORDER[idx + 1]
+        next_stage = NEXT_STAGE.get(self.state.current_stage)
+        if next_stage is not None:
+            self.state.current_stage = next_stage
             self.state.stage_initialized = False
             self.state.waiting_for_player = False
             self.state.sub_step = 0
 
+    def step(self) -> bool:
+        """Run the current stage's logic; True once the stage is complete."""
+        return self._run_table[self.state.current_stage]()
+
+    def handle_input(self, player_input: str):
+        """Pass player input to the current stage's handler, if it takes any."""
+        handler = self._handle_table.get(self.state.current_stage)
+        if handler:
+            handler(player_input)
+
     def get_stage_label(self) -> str:
         return STAGE_DISPLAY.get(self.state.current_stage, "Unknown Stage")
 
-    def get_recent_context(self, n: int = 10) -> str:
-        recent = self.state.dialogues[-n:]
-        lines = []
-        for d in recent:
-            lines.append(f"{d.speaker} ({d.role.value}): {d.text}")
-        return "\n".join(lines)
+    def get_recent_context(self, n: int = 10, budget_tokens: Optional[int] = None) -> str:
+        """Last n dialogue lines, or with budget_tokens as many recent lines as fit in it.
+
+        The newest line is always included, cut to the budget if it is
+        longer than that on its own.
+        """
+        key = (n, budget_tokens)
+        context = self._context_cache.get(key)
+        if context is None:
+            lines = self._recent_lines
+            if budget_tokens is not None:
+                n = spent = 0
+                for cost in reversed(self._recent_tokens):
+                    spent += cost
+                    if spent > budget_tokens:
+                        break
+                    n += 1
+            if n > 0:
+                context = "\n".join(lines[-n:])
+            elif budget_tokens is not None and lines:
+                context = lines[-1][:budget_tokens * CHARS_PER_TOKEN]
+            else:
+                context = ""
+            self._context_cache[key] = context
+        return context
 
     # ─── STAGE PROCESSORS ───────────────────────────────────────
 
@@ -61,21 +307,16 @@ class TrialEngine:
         if self.state.stage_initialized:
             return True  # done
 
-        clerk = self.get_character_by_role(RoleType.CLERK)
-        self.add_dialogue(
-            clerk.name, RoleType.CLERK,
-            f"May it please the Court. {self.case_info.case_number}. "
-            f"{self.case_info.title} is called for hearing."
-        )
-
-        judge = self.get_character_by_role(RoleType.JUDGE)
-        self.add_dialogue(judge.name, RoleType.JUDGE, "Appearances?")
-
-        pp = self.get_character_by_role(RoleType.PROSECUTOR)
-        self.add_dialogue(pp.name, RoleType.PROSECUTOR, "Learned Public Prosecutor for the State, My Lord.")
-
-        defence = self.get_character_by_role(RoleType.DEFENCE)
-        self.add_dialogue(defence.name, RoleType.DEFENCE, "Counsel for the accused, My Lord.")
+        self._add_many([
+            (
+                self.clerk.name, RoleType.CLERK,
+                f"May it please the Court. {self.case_info.case_number}. "
+                f"{self.case_info.title} is called for hearing.",
+            ),
+            (self.judge.name, RoleType.JUDGE, _CANNED["APPEARANCES"]),
+            (self.pp.name, RoleType.PROSECUTOR, _CANNED["PP_APPEARANCE"]),
+            (self.defence.name, RoleType.DEFENCE, _CANNED["DEFENCE_APPEARANCE"]),
+        ])
 
         self.state.stage_initialized = True
         return True  # auto-advance
@@ -85,13 +326,9 @@ class TrialEngine:
         if self.state.stage_initialized:
             return True
 
-        judge = self.get_character_by_role(RoleType.JUDGE)
-        pp = self.get_character_by_role(RoleType.PROSECUTOR)
-        defence = self.get_character_by_role(RoleType.DEFENCE)
-
         self.add_dialogue(
-            judge.name, RoleType.JUDGE,
-            "Have copies under Section 207 CrPC been supplied to the accused?"
+            self.judge.name, RoleType.JUDGE,
+            _CANNED["SUPPLY_QUERY"]
         )
 
         if self.is_player(RoleType.PROSECUTOR):
@@ -99,131 +336,123 @@ class TrialEngine:
             self.state.stage_initialized = True
             return False
 
-        self.add_dialogue(pp.name, RoleType.PROSECUTOR, "Yes, My Lord. All documents have been supplied.")
+        self.add_dialogue(self.pp.name, RoleType.PROSECUTOR, _CANNED["DOCUMENTS_SUPPLIED"])
 
         if self.is_player(RoleType.DEFENCE):
             self.state.waiting_for_player = True
             self.state.stage_initialized = True
             return False
 
-        self.add_dialogue(defence.name, RoleType.DEFENCE, "Received, My Lord.")
+        self.add_dialogue(self.defence.name, RoleType.DEFENCE, _CANNED["RECEIVED"])
         self.state.stage_initialized = True
         return True
 
     def handle_cognizance_input(self, player_input: str):
         """Handle player input during cognizance stage."""
-        player_char = self.get_character_by_role(self.state.player_role)
-        self.add_dialogue(player_char.name, self.state.player_role, player_input, is_player=True)
+        self._record_player(player_input)
 
-        if self.state.player_role == RoleType.PROSECUTOR:
-            defence = self.get_character_by_role(RoleType.DEFENCE)
+        if self.is_player(RoleType.PROSECUTOR):
             if self.is_player(RoleType.DEFENCE):
                 self.state.sub_step = 1
             else:
-                self.add_dialogue(defence.name, RoleType.DEFENCE, "Received, My Lord.")
+                self.add_dialogue(self.defence.name, RoleType.DEFENCE, _CANNED["RECEIVED"])
                 self.state.waiting_for_player = False
         else:
             self.state.waiting_for_player = False
 
     def run_charge_stage(self) -> bool:
         """Stage 3: Charge — PP argues, Defence argues for discharge, Judge frames charge."""
-        # sub_step 30 means charge stage fully complete
-        if self.state.sub_step >= 30:
+        if self.state.sub_step >= ChargeStep.DONE:
             return True
 
         if self.state.stage_initialized:
             return False  # waiting for player interaction
 
-        judge = self.get_character_by_role(RoleType.JUDGE)
-        self.add_dialogue(judge.name, RoleType.JUDGE, "Arguments on charge.")
+        self.add_dialogue(self.judge.name, RoleType.JUDGE, _CANNED["CHARGE_ARGUMENTS"])
 
         # Prosecution argues for charge
         if self.is_player(RoleType.PROSECUTOR):
             self.state.waiting_for_player = True
             self.state.stage_initialized = True
-            self.state.sub_step = 0
+            self.state.sub_step = ChargeStep.PROSECUTION_ARGUES
             return False
 
-        context = f"Stage: Charge hearing. Judge has asked for arguments on charge. Sections: {', '.join(self.case_info.sections)}."
-        pp_response = self.agents.get_response("prosecutor", context)
-        pp = self.get_character_by_role(RoleType.PROSECUTOR)
-        self.add_dialogue(pp.name, RoleType.PROSECUTOR, pp_response)
+        context = f"Stage: Charge hearing. Judge has asked for arguments on charge. Sections: {self._sections_csv}."
+        pp_response = self._cached_response("prosecutor", context)
+        self.add_dialogue(self.pp.name, RoleType.PROSECUTOR, pp_response)
 
         # Defence argues for discharge
         if self.is_player(RoleType.DEFENCE):
             self.state.waiting_for_player = True
             self.state.stage_initialized = True
-            self.state.sub_step = 1
+            self.state.sub_step = ChargeStep.DEFENCE_ARGUES
             return False
 
         context = f"Stage: Charge hearing. Prosecution has argued. Now defence argues for discharge.\n{self.get_recent_context(5)}"
-        def_response = self.agents.get_response("defence", context)
-        defence = self.get_character_by_role(RoleType.DEFENCE)
-        self.add_dialogue(defence.name, RoleType.DEFENCE, def_response)
+        def_response = self._cached_response("defence", context)
+        self.add_dialogue(self.defence.name, RoleType.DEFENCE, def_response)
 
         # Judge frames charge
         self._judge_frames_charge()
         self.state.stage_initialized = True
-        return self.state.sub_step >= 30
+        return self.state.sub_step >= ChargeStep.DONE
 
     def _judge_frames_charge(self):
-        judge = self.get_character_by_role(RoleType.JUDGE)
-        accused = self.get_character_by_role(RoleType.ACCUSED)
-
         if self.is_player(RoleType.JUDGE):
             self.state.waiting_for_player = True
-            self.state.sub_step = 10
+            self.state.sub_step = ChargeStep.JUDGE_FRAMES
             return
 
         context = (
-            f"Both sides have argued on charge. Frame charges under {', '.join(self.case_info.sections)} "
+            f"Both sides have argued on charge. Frame charges under {self._sections_csv} "
             f"and ask the accused to plead.\n{self.get_recent_context(6)}"
         )
-        judge_response = self.agents.get_response("judge", context)
-        self.add_dialogue(judge.name, RoleType.JUDGE, judge_response)
+        judge_response = self._cached_response("judge", context)
+        self.add_dialogue(self.judge.name, RoleType.JUDGE, judge_response)
 
         # Accused pleads
         if self.is_player(RoleType.ACCUSED):
             self.state.waiting_for_player = True
-            self.state.sub_step = 20
+            self.state.sub_step = ChargeStep.ACCUSED_PLEADS
             return
 
-        self.add_dialogue(accused.name, RoleType.ACCUSED, "I plead not guilty and claim trial, My Lord.")
+        self.add_dialogue(self.accused.name, RoleType.ACCUSED, _CANNED["NOT_GUILTY"])
         # Mark charge stage as complete
-        self.state.sub_step = 30
+        self.state.sub_step = ChargeStep.DONE
         self.state.waiting_for_player = False
 
     def handle_charge_input(self, player_input: str):
-        player_char = self.get_character_by_role(self.state.player_role)
-        self.add_dialogue(player_char.name, self.state.player_role, player_input, is_player=True)
-
-        if self.state.sub_step == 0:
-            # Player was prosecutor, now defence argues (AI)
-            context = f"Charge hearing. Defence turn to argue for discharge.\n{self.get_recent_context(5)}"
-            def_response = self.agents.get_response("defence", context)
-            defence = self.get_character_by_role(RoleType.DEFENCE)
-            self.add_dialogue(defence.name, RoleType.DEFENCE, def_response)
-            self._judge_frames_charge()
-
-        elif self.state.sub_step == 1:
-            # Player was defence, now judge frames charge + accused pleads (all AI)
-            self._judge_frames_charge()
-
-        elif self.state.sub_step == 10:
-            # Player was judge framing charges, now accused pleads
-            accused = self.get_character_by_role(RoleType.ACCUSED)
-            if self.is_player(RoleType.ACCUSED):
-                self.state.sub_step = 20
-                self.state.waiting_for_player = True
-                return
-            self.add_dialogue(accused.name, RoleType.ACCUSED, "I plead not guilty and claim trial, My Lord.")
-            self.state.sub_step = 30
-            self.state.waiting_for_player = False
+        self._record_player(player_input)
 
-        elif self.state.sub_step == 20:
-            # Accused has pleaded
-            self.state.sub_step = 30
-            self.state.waiting_for_player = False
+        step = self._charge_dispatch.get(self.state.sub_step)
+        if step:
+            step()
+
+    def _charge_after_pp_player(self):
+        # Player was prosecutor, now defence argues (AI)
+        context = f"Charge hearing. Defence turn to argue for discharge.\n{self.get_recent_context(5)}"
+        def_response = self._cached_response("defence", context)
+        self.add_dialogue(self.defence.name, RoleType.DEFENCE, def_response)
+        self._judge_frames_charge()
+
+    def _charge_after_def_player(self):
+        # Player was defence, now judge frames charge + accused pleads (all AI)
+        self._judge_frames_charge()
+
+    def _charge_after_judge_player(self):
+        # Player was judge framing charges, now accused pleads
+        if self.is_player(RoleType.ACCUSED):
+            self.state.sub_step = ChargeStep.ACCUSED_PLEADS
+            self.state.waiting_for_player = True
+            return
+        self.add_dialogue(self.accused.name, RoleType.ACCUSED, _CANNED["NOT_GUILTY"])
+        self.state.sub_step = ChargeStep.DONE
+        self.state.waiting_for_player = False
+
+    def _charge_after_accused_player(self):
+        # Accused has pleaded
+        self.state.sub_step = ChargeStep.DONE
+        self.state.waiting_for_player = False
 
     def run_prosecution_opening(self) -> bool:
         """Stage 4: Prosecution opens its case."""
@@ -237,63 +466,111 @@ class TrialEngine:
 
         context = (
             f"Stage 4: You open the prosecution's case. Explain the prosecution story and list the witnesses "
-            f"you will examine. Witnesses: {', '.join(w.designation for w in self.pw_witnesses)}."
+            f"you will examine. Witnesses: {self._pw_designations_csv}."
         )
-        pp_response = self.agents.get_response("prosecutor", context)
-        pp = self.get_character_by_role(RoleType.PROSECUTOR)
-        self.add_dialogue(pp.name, RoleType.PROSECUTOR, pp_response)
+        pp_response = self._cached_response("prosecutor", context)
+        self.add_dialogue(self.pp.name, RoleType.PROSECUTOR, pp_response)
         self.state.stage_initialized = True
         return True
 
     def handle_prosecution_opening_input(self, player_input: str):
-        player_char = self.get_character_by_role(self.state.player_role)
-        self.add_dialogue(player_char.name, self.state.player_role, player_input, is_player=True)
+        self._record_player(player_input)
         self.state.waiting_for_player = False
 
     # ─── WITNESS TESTIMONY HELPERS ─────────────────────────────
 
     def _get_witness_testimony(self, wi: int, is_dw: bool = False) -> str:
         """Get all testimony for a specific witness so far."""
+        self._collect_summary(wi, is_dw)
+        text = self._testimony_text.get((is_dw, wi))
+        if text is not None:
+            return text
         transcripts = self.state.dw_chief_exam_transcripts if is_dw else self.state.chief_exam_transcripts
+        summaries = self.state.dw_chief_exam_summaries if is_dw else self.state.chief_exam_summaries
         lines = transcripts.get(wi, [])
-        return "\n".join(lines) if lines else "(No testimony yet)"
+        summary = summaries.get(wi)
+        if summary:
+            text = f"(Summary of earlier testimony) {summary}\n" + "\n".join(lines)
+        elif lines:
+            text = "\n".join(lines)
+        else:
+            return "(No testimony yet)"
+        self._testimony_text[(is_dw, wi)] = text
+        return text
 
     def _record_testimony(self, wi: int, speaker: str, text: str, is_dw: bool = False):
         """Record a Q&A exchange into the witness transcript."""
+        self._collect_summary(wi, is_dw)
         transcripts = self.state.dw_chief_exam_transcripts if is_dw else self.state.chief_exam_transcripts
         if wi not in transcripts:
             transcripts[wi] = []
-        transcripts[wi].append(f"{speaker}: {text}")
+        lines = transcripts[wi]
+        line = f"{speaker}: {text}"
+        lines.append(line)
+        key = (is_dw, wi)
+        if key in self._testimony_text:
+            self._testimony_text[key] += "\n" + line
+        phase = self.state.dw_exam_phase if is_dw else self.state.current_exam_phase
+        if speaker == "Q" and phase == WitnessExamPhase.CROSS:
+            witness_key = f"dw_{wi}" if is_dw else f"pw_{wi}"
+            self.state.cross_exam_questions.setdefault(witness_key, []).append(text)
+        if len(lines) > 2 * TESTIMONY_RECENT_LINES and key not in self._pending_summaries:
+            self._summarize_testimony(wi, is_dw)
+
+    def _summarize_testimony(self, wi: int, is_dw: bool = False):
+        """Start folding all but the most recent transcript lines into the witness's running summary.
+
+        The lines are copied and the prompt built here; the summarizer runs
+        on the prefetch pool against a snapshot while the examination goes
+        on, and _collect_summary applies its result once it is ready.
+        """
+        transcripts = self.state.dw_chief_exam_transcripts if is_dw else self.state.chief_exam_transcripts
+        summaries = self.state.dw_chief_exam_summaries if is_dw else self.state.chief_exam_summaries
+        folded = tuple(transcripts[wi][:-TESTIMONY_RECENT_LINES])
+        previous = summaries.get(wi)
+        record = "\n".join(folded)
+        if previous:
+            record = f"Earlier summary: {previous}\n{record}"
+        future = _PREFETCH_POOL.submit(
+            self.agents.response_task("summarizer", f"Summarize concisely:\n{record}")
+        )
+        self._pending_summaries[(is_dw, wi)] = (folded, future)
 
-    def _get_next_exam_topic(self, wi: int) -> str:
-        """Get the next examination topic for the prosecutor (chief exam)."""
-        witness = self.pw_witnesses[wi]
-        topics = witness.chief_exam_topics
-        idx = self.state.witness_question_count
-        if idx < len(topics):
-            return topics[idx]
-        return "Ask any remaining clarifying question to conclude this examination."
+    def _collect_summary(self, wi: int, is_dw: bool = False):
+        """Swap a finished background summary in for the transcript lines it covers."""
+        key = (is_dw, wi)
+        pending = self._pending_summaries.get(key)
+        if pending is None or not pending[1].done():
+            return
+        del self._pending_summaries[key]
+        folded, future = pending
+        summary = future.result()
+        if summary.startswith("[AI Error") or summary == "[Agent not found]":
+            return  # keep the raw lines and try again on the next record
+        transcripts = self.state.dw_chief_exam_transcripts if is_dw else self.state.chief_exam_transcripts
+        lines = transcripts.get(wi, [])
+        if tuple(lines[:len(folded)]) != folded:
+            return  # the transcript no longer starts with the lines that were summarized
+        summaries = self.state.dw_chief_exam_summaries if is_dw else self.state.chief_exam_summaries
+        summaries[wi] = summary
+        del lines[:len(folded)]
+        self._testimony_text.pop(key, None)
 
-    def _get_next_cross_point(self, wi: int) -> str:
-        """Get the next cross-examination point for the defence."""
-        witness = self.pw_witnesses[wi]
-        points = witness.cross_exam_points
-        idx = self.state.witness_question_count
-        if idx < len(points):
-            return points[idx]
-        return "Ask any final challenging question to conclude cross-examination."
+    def _re_exam_needed(self, witness_key: str) -> bool:
+        """Whether the witness was cross-examined at all; with no cross there is nothing to repair."""
+        return bool(self.state.cross_exam_questions.get(witness_key))
+
+    @staticmethod
+    def _witness_context_prefix(witness) -> str:
+        return WITNESS_CONTEXT_PREFIX.format(label=witness.prompt_label, facts_known=witness.facts_known)
 
     def _build_witness_context(self, wi: int, phase: WitnessExamPhase, question: str) -> str:
         """Build rich context for a witness to answer, including their prior testimony."""
-        witness = self.pw_witnesses[wi]
-        prior = self._get_witness_testimony(wi)
-        return (
-            f"You are {witness.name} ({witness.designation}) testifying in court.\n"
-            f"Current phase: {phase.value}\n\n"
-            f"YOUR PRIOR TESTIMONY IN THIS TRIAL (you MUST stay consistent with this):\n{prior}\n\n"
-            f"YOUR KNOWLEDGE: {witness.facts_known}\n\n"
-            f"Question asked: \"{question}\"\n"
-            f"Answer the question concisely (1-3 sentences). Stay consistent with your prior testimony."
+        return PW_ANSWER_CONTEXT.format(
+            prefix=self._witness_prefix[wi],
+            prior=self._get_witness_testimony(wi),
+            phase=phase.value,
+            question=question,
         )
 
     # ─── STAGE 5: WITNESS EXAMINATION ────────────────────────
@@ -303,132 +580,109 @@ class TrialEngine:
         wi = self.state.current_witness_index
         if wi >= len(self.pw_witnesses):
             # All witnesses examined — close prosecution evidence
-            pp = self.get_character_by_role(RoleType.PROSECUTOR)
             if not self.state.stage_initialized:
-                self.add_dialogue(pp.name, RoleType.PROSECUTOR, "My Lord, prosecution evidence is closed.")
+                self.add_dialogue(self.pp.name, RoleType.PROSECUTOR, _CANNED["PW_CLOSED"])
                 self.state.stage_initialized = True
             return True
 
         witness = self.pw_witnesses[wi]
 
         if not self.state.stage_initialized:
-            # Call the witness
-            clerk = self.get_character_by_role(RoleType.CLERK)
+            # Call the witness and administer the oath in one clerk announcement
             self.add_dialogue(
-                clerk.name, RoleType.CLERK,
-                f"{witness.designation} — {witness.name} is called to the witness stand."
+                self.clerk.name, RoleType.CLERK,
+                f"{witness.designation} — {witness.name} is called to the witness stand. "
+                f"{witness.name}, please tell the truth. You may begin."
             )
-            judge = self.get_character_by_role(RoleType.JUDGE)
-            self.add_dialogue(judge.name, RoleType.JUDGE, f"{witness.name}, please tell the truth. You may begin.")
             self.state.stage_initialized = True
             self.state.current_exam_phase = WitnessExamPhase.CHIEF
             self.state.witness_question_count = 0
+            self.state.cross_exam_questions[f"pw_{wi}"] = []
 
         self.state.waiting_for_player = True
         return False
 
     def handle_witness_exam_input(self, player_input: str):
         """Handle player input during witness examination."""
+        self._record_player(player_input)
         wi = self.state.current_witness_index
-        witness = self.pw_witnesses[wi]
         phase = self.state.current_exam_phase
-        player_char = self.get_character_by_role(self.state.player_role)
-        witness_key = f"pw_{wi}"
-
-        # Determine examiner for this phase
-        if phase == WitnessExamPhase.CHIEF:
-            examiner_role = RoleType.PROSECUTOR
-        elif phase == WitnessExamPhase.CROSS:
-            examiner_role = RoleType.DEFENCE
-        else:
-            examiner_role = RoleType.PROSECUTOR
 
         # Player IS the examiner — they ask, witness AI answers
-        if self.is_player(examiner_role):
-            self.add_dialogue(player_char.name, self.state.player_role, player_input, is_player=True)
+        if self.is_player(_PW_EXAMINER[phase][1]):
             self._record_testimony(wi, "Q", player_input)
 
             w_context = self._build_witness_context(wi, phase, player_input)
-            witness_response = self.agents.get_response(witness_key, w_context, player_input)
-            self.add_dialogue(witness.name, RoleType.WITNESS_PW, witness_response)
+            witness_response = self._cached_response(f"pw_{wi}", w_context, player_input)
+            self.add_dialogue(self.pw_witnesses[wi].name, RoleType.WITNESS_PW, witness_response)
             self._record_testimony(wi, "A", witness_response)
             self.state.witness_question_count += 1
 
         # Player is the witness — they answer (examiner AI question already shown)
         elif self.is_player(RoleType.WITNESS_PW):
-            self.add_dialogue(player_char.name, self.state.player_role, player_input, is_player=True)
             self._record_testimony(wi, "A", player_input)
             self.state.witness_question_count += 1
 
-        # Player is judge — interjection, then AI continues
-        elif self.is_player(RoleType.JUDGE):
-            self.add_dialogue(player_char.name, self.state.player_role, player_input, is_player=True)
-            # AI examiner and witness exchange happens via auto_witness_exchange next
-
-        # Player is accused or other — just observe
-        else:
-            self.add_dialogue(player_char.name, self.state.player_role, player_input, is_player=True)
+        # A judge's interjection or an observer's remark needs nothing more;
+        # the examination continues via auto_witness_exchange
 
     def auto_witness_exchange(self):
-        """Generate one AI examiner question + AI witness answer."""
+        """Generate one AI examiner question + AI witness answer.
+
+        Yields (tag, character, chunk) while the replies stream in, "Q" for the
+        examiner and "A" for the witness. Dialogue and testimony are recorded
+        once each reply is complete, so the generator must be exhausted.
+        """
         wi = self.state.current_witness_index
         witness = self.pw_witnesses[wi]
         phase = self.state.current_exam_phase
         witness_key = f"pw_{wi}"
 
-        if phase == WitnessExamPhase.CHIEF:
-            examiner_role = RoleType.PROSECUTOR
-            examiner_key = "prosecutor"
-        elif phase == WitnessExamPhase.CROSS:
-            examiner_role = RoleType.DEFENCE
-            examiner_key = "defence"
-        else:
-            examiner_role = RoleType.PROSECUTOR
-            examiner_key = "prosecutor"
+        examiner_key, examiner_role = _PW_EXAMINER[phase]
 
         if self.is_player(examiner_role):
             return  # player asks manually
 
         examiner_char = self.get_character_by_role(examiner_role)
 
-        # Build structured context for the examiner
+        # Build structured context for the examiner; the next scripted topic or
+        # cross point is picked by this phase's question count
+        idx = self.state.witness_question_count
         if phase == WitnessExamPhase.CHIEF:
-            topic = self._get_next_exam_topic(wi)
-            prior = self._get_witness_testimony(wi)
-            context = (
-                f"EXAMINATION-IN-CHIEF of {witness.name} ({witness.designation}).\n"
-                f"You are the Public Prosecutor examining this witness.\n\n"
-                f"INSTRUCTION: {topic}\n\n"
-                f"TESTIMONY SO FAR:\n{prior}\n\n"
-                f"Ask ONE clear, open-ended question. Do NOT repeat a question already asked."
+            topics = witness.chief_exam_topics
+            topic = (
+                topics[idx] if idx < len(topics)
+                else "Ask any remaining clarifying question to conclude this examination."
+            )
+            context = PW_CHIEF_CONTEXT.format(
+                label=witness.prompt_label, prior=self._get_witness_testimony(wi), instruction=topic,
             )
         elif phase == WitnessExamPhase.CROSS:
-            point = self._get_next_cross_point(wi)
-            chief_transcript = self._get_witness_testimony(wi)
-            context = (
-                f"CROSS-EXAMINATION of {witness.name} ({witness.designation}).\n"
-                f"You are Defence Counsel cross-examining this prosecution witness.\n\n"
-                f"WITNESS'S CHIEF-EXAM TESTIMONY (use this to find contradictions):\n{chief_transcript}\n\n"
-                f"INSTRUCTION: {point}\n\n"
-                f"Ask ONE pointed, leading question. Challenge credibility or expose contradictions."
+            points = witness.cross_exam_points
+            point = (
+                points[idx] if idx < len(points)
+                else "Ask any final challenging question to conclude cross-examination."
+            )
+            context = PW_CROSS_CONTEXT.format(
+                label=witness.prompt_label, prior=self._get_witness_testimony(wi), instruction=point,
             )
         else:  # RE_EXAMINATION
-            chief_transcript = self._get_witness_testimony(wi)
-            context = (
-                f"RE-EXAMINATION of {witness.name} ({witness.designation}).\n"
-                f"You are the Public Prosecutor. Clarify any point damaged during cross-examination.\n\n"
-                f"FULL TESTIMONY SO FAR:\n{chief_transcript}\n\n"
-                f"Ask ONE clarifying question about a point raised in cross-examination, or say 'No re-examination, My Lord.'"
+            if not self._re_exam_needed(witness_key):
+                self.add_dialogue(examiner_char.name, examiner_role, _CANNED["NO_RE_EXAM"])
+                self.advance_exam_phase()
+                return
+            context = PW_RE_EXAM_CONTEXT.format(
+                label=witness.prompt_label, prior=self._get_witness_testimony(wi),
             )
 
-        question = self.agents.get_response(examiner_key, context)
+        question = yield from self._stream_turn("Q", examiner_char, examiner_key, context)
         self.add_dialogue(examiner_char.name, examiner_role, question)
         self._record_testimony(wi, "Q", question)
 
         # Witness answers (if not player)
         if not self.is_player(RoleType.WITNESS_PW):
             w_context = self._build_witness_context(wi, phase, question)
-            answer = self.agents.get_response(witness_key, w_context, question)
+            answer = yield from self._stream_turn("A", witness, witness_key, w_context, question)
             self.add_dialogue(witness.name, RoleType.WITNESS_PW, answer)
             self._record_testimony(wi, "A", answer)
 
@@ -436,23 +690,23 @@ class TrialEngine:
 
     def advance_exam_phase(self):
         """Move to next exam phase or next witness."""
-        phase = self.state.current_exam_phase
-        if phase == WitnessExamPhase.CHIEF:
-            self.state.current_exam_phase = WitnessExamPhase.CROSS
-            self.state.witness_question_count = 0  # reset for cross
-            judge = self.get_character_by_role(RoleType.JUDGE)
-            self.add_dialogue(judge.name, RoleType.JUDGE, "Defence, you may cross-examine the witness.")
-        elif phase == WitnessExamPhase.CROSS:
-            self.state.current_exam_phase = WitnessExamPhase.RE_EXAMINATION
-            self.state.witness_question_count = 0  # reset for re-exam
-            judge = self.get_character_by_role(RoleType.JUDGE)
-            self.add_dialogue(judge.name, RoleType.JUDGE, "Prosecution, any re-examination?")
-        else:
+        next_phase = self._next_exam_phase(self.state.current_exam_phase, _PW_PHASE_ADVANCE)
+        if next_phase is None:
             # Done with this witness, move to next
             self.state.current_witness_index += 1
-            self.state.current_exam_phase = WitnessExamPhase.CHIEF
-            self.state.witness_question_count = 0
+            next_phase = WitnessExamPhase.CHIEF
             self.state.stage_initialized = False
+        self.state.current_exam_phase = next_phase
+
+    def _next_exam_phase(self, phase: WitnessExamPhase, table: dict) -> Optional[WitnessExamPhase]:
+        """Open the phase after this one and return it, or None once the witness is done."""
+        self.state.witness_question_count = 0  # topics restart with each phase
+        step = table.get(phase)
+        if step is None:
+            return None
+        next_phase, announcement = step
+        self.add_dialogue(self.judge.name, RoleType.JUDGE, announcement)
+        return next_phase
 
     def run_accused_statement(self) -> bool:
         """Stage 6: Statement of Accused — Judge asks, accused answers. No cross-exam."""
@@ -460,9 +714,8 @@ class TrialEngine:
             return True
 
         if not self.state.stage_initialized:
-            judge = self.get_character_by_role(RoleType.JUDGE)
             self.add_dialogue(
-                judge.name, RoleType.JUDGE,
+                self.judge.name, RoleType.JUDGE,
                 "Under Section 313 CrPC, I shall now examine the accused. "
                 "The accused is reminded that this is not on oath and there is no cross-examination."
             )
@@ -480,9 +733,8 @@ class TrialEngine:
                 f"Ask question {self.state.sub_step + 1} of 3 based on prosecution evidence. "
                 f"Previous exchanges:\n{self.get_recent_context(6)}"
             )
-            judge = self.get_character_by_role(RoleType.JUDGE)
-            question = self.agents.get_response("judge", context)
-            self.add_dialogue(judge.name, RoleType.JUDGE, question)
+            question = self._cached_response("judge", context)
+            self.add_dialogue(self.judge.name, RoleType.JUDGE, question)
 
             # Accused answers
             if self.is_player(RoleType.ACCUSED):
@@ -490,26 +742,23 @@ class TrialEngine:
                 return False
 
             a_context = f"The Judge asked you: \"{question}\". Answer based on your version of events."
-            accused = self.get_character_by_role(RoleType.ACCUSED)
-            answer = self.agents.get_response("accused", a_context, question)
-            self.add_dialogue(accused.name, RoleType.ACCUSED, answer)
+            answer = self._cached_response("accused", a_context, question)
+            self.add_dialogue(self.accused.name, RoleType.ACCUSED, answer)
             self.state.sub_step += 1
             return False
         else:
             return True
 
     def handle_accused_statement_input(self, player_input: str):
-        player_char = self.get_character_by_role(self.state.player_role)
-        self.add_dialogue(player_char.name, self.state.player_role, player_input, is_player=True)
+        self._record_player(player_input)
 
         if self.is_player(RoleType.JUDGE):
             # Player judge asked, accused AI answers
-            accused = self.get_character_by_role(RoleType.ACCUSED)
             if self.is_player(RoleType.ACCUSED):
                 return
             a_context = f"The Judge asked: \"{player_input}\". Answer."
-            answer = self.agents.get_response("accused", a_context, player_input)
-            self.add_dialogue(accused.name, RoleType.ACCUSED, answer)
+            answer = self._cached_response("accused", a_context, player_input)
+            self.add_dialogue(self.accused.name, RoleType.ACCUSED, answer)
             self.state.sub_step += 1
             if self.state.sub_step >= 3:
                 self.state.waiting_for_player = False
@@ -524,84 +773,60 @@ class TrialEngine:
         """Stage 7: Defence Evidence (Optional)."""
         if not self.dw_witnesses:
             if not self.state.stage_initialized:
-                defence = self.get_character_by_role(RoleType.DEFENCE)
-                self.add_dialogue(defence.name, RoleType.DEFENCE, "The defence does not wish to lead any evidence, My Lord.")
+                self.add_dialogue(self.defence.name, RoleType.DEFENCE, _CANNED["NO_DEFENCE_EVIDENCE"])
                 self.state.stage_initialized = True
             return True
 
         dwi = self.state.dw_index
         if dwi >= len(self.dw_witnesses):
             if not self.state.is_defence_evidence_phase:
-                defence = self.get_character_by_role(RoleType.DEFENCE)
-                self.add_dialogue(defence.name, RoleType.DEFENCE, "Defence evidence is closed, My Lord.")
+                self.add_dialogue(self.defence.name, RoleType.DEFENCE, _CANNED["DW_CLOSED"])
                 self.state.is_defence_evidence_phase = True
             return True
 
         dw = self.dw_witnesses[dwi]
         if not self.state.stage_initialized:
-            defence = self.get_character_by_role(RoleType.DEFENCE)
-            self.add_dialogue(defence.name, RoleType.DEFENCE, f"The defence wishes to examine {dw.designation} — {dw.name}.")
-            clerk = self.get_character_by_role(RoleType.CLERK)
-            self.add_dialogue(clerk.name, RoleType.CLERK, f"{dw.designation} — {dw.name} is called to the witness stand.")
+            self._add_many([
+                (self.defence.name, RoleType.DEFENCE, f"The defence wishes to examine {dw.designation} — {dw.name}."),
+                (self.clerk.name, RoleType.CLERK, f"{dw.designation} — {dw.name} is called to the witness stand."),
+            ])
             self.state.stage_initialized = True
             self.state.dw_exam_phase = WitnessExamPhase.CHIEF
+            self.state.cross_exam_questions[f"dw_{dwi}"] = []
 
         self.state.waiting_for_player = True
         return False
 
     def _build_dw_context(self, dwi: int, phase: WitnessExamPhase, question: str) -> str:
         """Build rich context for a defence witness to answer."""
-        dw = self.dw_witnesses[dwi]
-        prior = self._get_witness_testimony(dwi, is_dw=True)
-        return (
-            f"You are {dw.name} ({dw.designation}) testifying in court.\n"
-            f"Current phase: {phase.value}\n\n"
-            f"YOUR PRIOR TESTIMONY (stay consistent):\n{prior}\n\n"
-            f"YOUR KNOWLEDGE: {dw.facts_known}\n\n"
-            f"Question asked: \"{question}\"\n"
-            f"Answer concisely (1-3 sentences). Stay consistent with prior testimony."
+        return DW_ANSWER_CONTEXT.format(
+            prefix=self._dw_prefix[dwi],
+            prior=self._get_witness_testimony(dwi, is_dw=True),
+            phase=phase.value,
+            question=question,
         )
 
     def handle_dw_exam_input(self, player_input: str):
+        self._record_player(player_input)
         dwi = self.state.dw_index
-        dw = self.dw_witnesses[dwi]
         phase = self.state.dw_exam_phase
-        player_char = self.get_character_by_role(self.state.player_role)
-        dw_key = f"dw_{dwi}"
 
-        if phase == WitnessExamPhase.CHIEF:
-            examiner_role = RoleType.DEFENCE
-        elif phase == WitnessExamPhase.CROSS:
-            examiner_role = RoleType.PROSECUTOR
-        else:
-            examiner_role = RoleType.DEFENCE
-
-        if self.is_player(examiner_role):
-            self.add_dialogue(player_char.name, self.state.player_role, player_input, is_player=True)
+        if self.is_player(_DW_EXAMINER[phase][1]):
             self._record_testimony(dwi, "Q", player_input, is_dw=True)
 
             w_context = self._build_dw_context(dwi, phase, player_input)
-            response = self.agents.get_response(dw_key, w_context, player_input)
-            self.add_dialogue(dw.name, RoleType.WITNESS_DW, response)
+            response = self._cached_response(f"dw_{dwi}", w_context, player_input)
+            self.add_dialogue(self.dw_witnesses[dwi].name, RoleType.WITNESS_DW, response)
             self._record_testimony(dwi, "A", response, is_dw=True)
-        else:
-            self.add_dialogue(player_char.name, self.state.player_role, player_input, is_player=True)
 
     def auto_dw_exchange(self):
+        """Defence-witness counterpart of auto_witness_exchange; also a generator."""
         dwi = self.state.dw_index
         dw = self.dw_witnesses[dwi]
         phase = self.state.dw_exam_phase
         dw_key = f"dw_{dwi}"
 
-        if phase == WitnessExamPhase.CHIEF:
-            examiner_role = RoleType.DEFENCE
-            examiner_key = "defence"
-        elif phase == WitnessExamPhase.CROSS:
-            examiner_role = RoleType.PROSECUTOR
-            examiner_key = "prosecutor"
-        else:
-            examiner_role = RoleType.DEFENCE
-            examiner_key = "defence"
+        examiner_key, examiner_role = _DW_EXAMINER[phase]
 
         if self.is_player(examiner_role):
             return
@@ -610,57 +835,42 @@ class TrialEngine:
         prior = self._get_witness_testimony(dwi, is_dw=True)
 
         if phase == WitnessExamPhase.CHIEF:
-            context = (
-                f"EXAMINATION-IN-CHIEF of {dw.name} ({dw.designation}).\n"
-                f"You are Defence Counsel examining your witness.\n\n"
-                f"TESTIMONY SO FAR:\n{prior}\n\n"
-                f"Ask ONE clear, open-ended question about what the witness knows."
-            )
+            template = DW_CHIEF_CONTEXT
         elif phase == WitnessExamPhase.CROSS:
-            context = (
-                f"CROSS-EXAMINATION of {dw.name} ({dw.designation}).\n"
-                f"You are the Public Prosecutor cross-examining this defence witness.\n\n"
-                f"WITNESS'S TESTIMONY:\n{prior}\n\n"
-                f"Ask ONE pointed question to challenge credibility. Note: this witness is the wife of the accused."
-            )
+            template = DW_CROSS_CONTEXT
         else:
-            context = (
-                f"RE-EXAMINATION of {dw.name} ({dw.designation}).\n"
-                f"You are Defence Counsel. Clarify one point from cross-examination.\n\n"
-                f"FULL TESTIMONY:\n{prior}\n\n"
-                f"Ask ONE clarifying question or say 'No re-examination, My Lord.'"
-            )
+            if not self._re_exam_needed(dw_key):
+                self.add_dialogue(examiner_char.name, examiner_role, _CANNED["NO_RE_EXAM"])
+                self.advance_dw_exam_phase()
+                return
+            template = DW_RE_EXAM_CONTEXT
+        context = template.format(label=dw.prompt_label, prior=prior)
 
-        question = self.agents.get_response(examiner_key, context)
+        question = yield from self._stream_turn("Q", examiner_char, examiner_key, context)
         self.add_dialogue(examiner_char.name, examiner_role, question)
         self._record_testimony(dwi, "Q", question, is_dw=True)
 
         if not self.is_player(RoleType.WITNESS_DW):
             w_context = self._build_dw_context(dwi, phase, question)
-            answer = self.agents.get_response(dw_key, w_context, question)
+            answer = yield from self._stream_turn("A", dw, dw_key, w_context, question)
             self.add_dialogue(dw.name, RoleType.WITNESS_DW, answer)
             self._record_testimony(dwi, "A", answer, is_dw=True)
 
     def advance_dw_exam_phase(self):
-        phase = self.state.dw_exam_phase
-        if phase == WitnessExamPhase.CHIEF:
-            self.state.dw_exam_phase = WitnessExamPhase.CROSS
-            judge = self.get_character_by_role(RoleType.JUDGE)
-            self.add_dialogue(judge.name, RoleType.JUDGE, "Prosecution, you may cross-examine.")
-        elif phase == WitnessExamPhase.CROSS:
-            self.state.dw_exam_phase = WitnessExamPhase.RE_EXAMINATION
-            judge = self.get_character_by_role(RoleType.JUDGE)
-            self.add_dialogue(judge.name, RoleType.JUDGE, "Defence, any re-examination?")
-        else:
+        next_phase = self._next_exam_phase(self.state.dw_exam_phase, _DW_PHASE_ADVANCE)
+        if next_phase is None:
             self.state.dw_index += 1
-            self.state.dw_exam_phase = WitnessExamPhase.CHIEF
+            next_phase = WitnessExamPhase.CHIEF
             self.state.stage_initialized = False
+        self.state.dw_exam_phase = next_phase
 
     def run_final_arguments(self) -> bool:
         """Stage 8: Final Arguments — Prosecution first, then Defence."""
+        if self.state.final_arg_turn == "done":
+            return True
+
         if not self.state.stage_initialized:
-            judge = self.get_character_by_role(RoleType.JUDGE)
-            self.add_dialogue(judge.name, RoleType.JUDGE, "The Court will now hear final arguments. Prosecution may begin.")
+            self.add_dialogue(self.judge.name, RoleType.JUDGE, _CANNED["FINAL_ARGS_OPEN"])
             self.state.stage_initialized = True
             self.state.final_arg_turn = "prosecution"
 
@@ -669,81 +879,126 @@ class TrialEngine:
                 self.state.waiting_for_player = True
                 return False
 
-            context = (
-                f"Stage 8: Final Arguments. You are the Public Prosecutor. Deliver your closing argument. "
-                f"Summarize the prosecution evidence, witness testimony, and argue guilt beyond reasonable doubt.\n"
-                f"Case summary:\n{self.get_recent_context(15)}"
+            context = CLOSING_CONTEXT.format(
+                record=self.get_recent_context(budget_tokens=CLOSING_RECORD_TOKENS)
             )
-            pp = self.get_character_by_role(RoleType.PROSECUTOR)
-            response = self.agents.get_response("prosecutor", context)
-            self.add_dialogue(pp.name, RoleType.PROSECUTOR, response)
+            response = self._streamed_response(self.pp, "prosecutor", context, PROSECUTOR_CLOSING_INSTRUCTIONS)
+            self.add_dialogue(self.pp.name, RoleType.PROSECUTOR, response)
             self.state.final_arg_turn = "defence"
 
-            judge = self.get_character_by_role(RoleType.JUDGE)
-            self.add_dialogue(judge.name, RoleType.JUDGE, "Defence, your final arguments.")
+            self.add_dialogue(self.judge.name, RoleType.JUDGE, _CANNED["DEFENCE_FINAL_ARGS"])
 
         if self.state.final_arg_turn == "defence":
             if self.is_player(RoleType.DEFENCE):
+                if not self.state.waiting_for_player:
+                    self._warm_verdict_prefix()
                 self.state.waiting_for_player = True
                 return False
 
-            context = (
-                f"Stage 8: Final Arguments. You are Defence Counsel. Deliver your closing argument. "
-                f"Highlight contradictions, delay in FIR, interested witnesses, and argue for acquittal.\n"
-                f"Case summary:\n{self.get_recent_context(20)}"
+            context = CLOSING_CONTEXT.format(
+                record=self.get_recent_context(budget_tokens=CLOSING_RECORD_TOKENS)
             )
-            defence = self.get_character_by_role(RoleType.DEFENCE)
-            response = self.agents.get_response("defence", context)
-            self.add_dialogue(defence.name, RoleType.DEFENCE, response)
+            response = self._streamed_response(self.defence, "defence", context, DEFENCE_CLOSING_INSTRUCTIONS)
+            self.add_dialogue(self.defence.name, RoleType.DEFENCE, response)
             self.state.final_arg_turn = "done"
-            return True
-
-        if self.state.final_arg_turn == "done":
+            self._prefetch_verdict()
             return True
 
         return False
 
     def handle_final_args_input(self, player_input: str):
-        player_char = self.get_character_by_role(self.state.player_role)
-        self.add_dialogue(player_char.name, self.state.player_role, player_input, is_player=True)
+        player_input, recache = self._split_recache_command(player_input)
+        if not player_input:
+            return  # a bare command is not an argument
+        self._record_player(player_input)
 
         if self.state.final_arg_turn == "prosecution":
             self.state.final_arg_turn = "defence"
-            judge = self.get_character_by_role(RoleType.JUDGE)
-            self.add_dialogue(judge.name, RoleType.JUDGE, "Defence, your final arguments.")
+            self.add_dialogue(self.judge.name, RoleType.JUDGE, _CANNED["DEFENCE_FINAL_ARGS"])
             self.state.waiting_for_player = False
 
         elif self.state.final_arg_turn == "defence":
             self.state.final_arg_turn = "done"
             self.state.waiting_for_player = False
+            # The verdict is the reply this closing leads to, so it is what
+            # RECACHE_COMMAND regenerates
+            if recache:
+                self._bypass_cache = True
+            self._prefetch_verdict()
+
+    def _judgment_context(self) -> str:
+        return VERDICT_CONTEXT.format(
+            record=self.get_recent_context(budget_tokens=VERDICT_RECORD_TOKENS)
+        )
+
+    def _warm_verdict_prefix(self):
+        """Have the provider cache the verdict prompt's fixed head while the player writes the defence closing.
+
+        Only the judge's system prompt, history and verdict instructions are
+        sent, with an empty record: the record window slides as the closing
+        is added, so no part of it would match the real request.
+        """
+        if self.is_player(RoleType.JUDGE):
+            return
+        _PREFETCH_POOL.submit(
+            self.agents.warm_task("judge", VERDICT_CONTEXT.format(record=""), JUDGE_VERDICT_INSTRUCTIONS)
+        )
+
+    def _prefetch_verdict(self):
+        """Start the AI judge's verdict while the player moves on from final arguments.
+
+        The record is complete once both sides have closed, so the prompt
+        run_judgment will send is already known. The worker only calls the
+        model; run_judgment records the verdict on the main thread if it uses it.
+        """
+        if self.is_player(RoleType.JUDGE):
+            return
+        context = self._judgment_context()
+        bypass, self._bypass_cache = self._bypass_cache, False
+        future = _PREFETCH_POOL.submit(
+            self.agents.response_task("judge", context, None, JUDGE_VERDICT_INSTRUCTIONS, bypass_cache=bypass)
+        )
+        self._speculative_verdict = (context, future)
 
     def run_judgment(self) -> bool:
         """Stage 9: Judgment."""
         if self.state.verdict:
             return True
+        if self.state.waiting_for_player:
+            return False
 
         if self.is_player(RoleType.JUDGE):
             self.state.waiting_for_player = True
             return False
 
-        judge = self.get_character_by_role(RoleType.JUDGE)
-        context = (
-            f"Stage 9: Judgment. You are the Sessions Judge. After hearing both sides and examining all evidence, "
-            f"deliver your judgment. Consider:\n"
-            f"- Prosecution witnesses and their credibility\n"
-            f"- Defence arguments about delay, contradictions, self-defence\n"
-            f"- Medical and forensic evidence\n"
-            f"- The accused's statement\n"
-            f"Pronounce either ACQUITTAL or CONVICTION with detailed reasoning (5-8 sentences).\n\n"
-            f"Full trial record:\n{self.get_recent_context(30)}"
-        )
-        verdict = self.agents.get_response("judge", context)
-        self.add_dialogue(judge.name, RoleType.JUDGE, verdict)
+        context = self._judgment_context()
+        verdict = None
+        if self._speculative_verdict:
+            spec_context, future = self._speculative_verdict
+            self._speculative_verdict = None
+            if spec_context == context:
+                verdict = future.result()
+                if verdict.startswith("[AI Error"):
+                    verdict = None  # ask again, streamed
+                else:
+                    h = self.agents.reply_key("judge", context, None, JUDGE_VERDICT_INSTRUCTIONS)
+                    self._resp_cache[h] = verdict
+                    self.agents.record_reply("judge", context, None, verdict)
+            else:
+                # The record changed after the prefetch started; the judge's
+                # memory never saw the speculative verdict, so just drop it
+                future.cancel()
+        if verdict is None:
+            verdict = self._streamed_response(self.judge, "judge", context, JUDGE_VERDICT_INSTRUCTIONS)
+        self.add_dialogue(self.judge.name, RoleType.JUDGE, verdict)
         self.state.verdict = verdict
         return True
 
     def handle_judgment_input(self, player_input: str):
-        player_char = self.get_character_by_role(self.state.player_role)
-        self.add_dialogue(player_char.name, self.state.player_role, player_input, is_player=True)
+        # No AI reply follows the player's verdict, so RECACHE_COMMAND is only stripped
+        player_input, _ = self._split_recache_command(player_input)
+        if not player_input:
+            return
+        self._record_player(player_input)
         self.state.verdict = player_input
         self.state.waiting_for_player = False
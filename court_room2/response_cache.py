@@ -0,0 +1,49 @@
+import hashlib
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+# Next to this module, whatever directory the app is launched from
+CACHE_PATH = str(Path(__file__).parent / ".trial_cache.sqlite3")
+CACHE_TTL_SECONDS = 30 * 24 * 60 * 60  # 30 days
+
+
+class ResponseCache:
+    """SQLite-backed store of agent replies, shared by every trial on this machine."""
+
+    def __init__(self, path: str = CACHE_PATH, ttl: float = CACHE_TTL_SECONDS):
+        self.ttl = ttl
+        # Streamlit serves sessions from several threads; one lock guards the connection
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, reply TEXT NOT NULL, created REAL NOT NULL)"
+        )
+        # get() ignores expired rows; drop them here so the file does not grow forever
+        self._conn.execute("DELETE FROM responses WHERE created < ?", (time.time() - ttl,))
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(*parts: str) -> str:
+        """Digest of everything that shapes a reply; a change in any part is a miss."""
+        return hashlib.sha256("\x00".join(parts).encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT reply, created FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None or time.time() - row[1] > self.ttl:
+            return None
+        return row[0]
+
+    def set(self, key: str, reply: str):
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, reply, created) VALUES (?, ?, ?)",
+                (key, reply, time.time()),
+            )
+            self._conn.commit()
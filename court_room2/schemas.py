@@ -1,6 +1,9 @@
-from enum import Enum
+import dataclasses
+from enum import Enum, IntEnum
+from functools import cached_property
 from typing import Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
+from pydantic.dataclasses import dataclass
 
 
 class RoleType(str, Enum):
@@ -37,7 +40,10 @@ STAGE_DISPLAY = {
     TrialStage.JUDGMENT: "Stage 9: Judgment",
 }
 
-STAGE_ORDER = list(TrialStage)
+STAGE_ORDER = tuple(TrialStage)
+STAGE_INDEX = {stage: i for i, stage in enumerate(STAGE_ORDER)}
+# Stage that follows each one; the last stage has no entry
+NEXT_STAGE = dict(zip(STAGE_ORDER, STAGE_ORDER[1:]))
 
 
 class WitnessExamPhase(str, Enum):
@@ -46,6 +52,15 @@ class WitnessExamPhase(str, Enum):
     RE_EXAMINATION = "Re-Examination"
 
 
+# GameState.sub_step during the charge stage: whose turn it is
+class ChargeStep(IntEnum):
+    PROSECUTION_ARGUES = 0
+    DEFENCE_ARGUES = 1
+    JUDGE_FRAMES = 10
+    ACCUSED_PLEADS = 20
+    DONE = 30
+
+
 class EvidenceStatus(str, Enum):
     NOT_PRESENTED = "Not Presented"
     PRESENTED = "Presented"
@@ -53,7 +68,10 @@ class EvidenceStatus(str, Enum):
     OBJECTED = "Objected"
 
 
-class Evidence(BaseModel):
+# Plain record with no methods and one instance per exhibit; a slotted
+# dataclass drops the per-instance __dict__ while keeping pydantic validation.
+@dataclass(frozen=True, slots=True)
+class Evidence:
     id: str
     name: str
     description: str
@@ -63,21 +81,30 @@ class Evidence(BaseModel):
 
 
 class Character(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     name: str
     role: RoleType
     designation: str  # e.g. "PW-1", "DW-1", "Sessions Judge"
     description: str
     personality: str
     facts_known: str  # what this character knows about the case
-    chief_exam_topics: list[str] = []  # topics prosecutor should cover
-    cross_exam_points: list[str] = []  # weak points defence should target
+    chief_exam_topics: tuple[str, ...] = ()  # topics prosecutor should cover
+    cross_exam_points: tuple[str, ...] = ()  # weak points defence should target
+
+    @cached_property
+    def prompt_label(self) -> str:
+        """Name and designation as shown in prompts, built once per character."""
+        return f"{self.name} ({self.designation})"
 
 
 class CaseInfo(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     title: str
     case_number: str
     court: str
-    sections: list[str]
+    sections: tuple[str, ...]
     fir_number: str
     fir_date: str
     fir_summary: str
@@ -87,7 +114,11 @@ class CaseInfo(BaseModel):
     defence_story: str
 
 
-class Dialogue(BaseModel):
+# One per spoken line, so a trial creates many of these. Only the engine
+# builds them, so a plain slotted dataclass skips per-line validation;
+# GameState still validates them when it is constructed.
+@dataclasses.dataclass(frozen=True, slots=True)
+class Dialogue:
     speaker: str
     role: RoleType
     text: str
@@ -101,7 +132,7 @@ class GameState(BaseModel):
     dialogues: list[Dialogue] = []
     current_witness_index: int = 0
     current_exam_phase: WitnessExamPhase = WitnessExamPhase.CHIEF
-    evidence_list: list[Evidence] = []
+    evidence_list: tuple[Evidence, ...] = ()
     is_defence_evidence_phase: bool = False
     dw_index: int = 0
     dw_exam_phase: WitnessExamPhase = WitnessExamPhase.CHIEF
@@ -115,3 +146,8 @@ class GameState(BaseModel):
     # Store chief-exam transcript per witness index for cross-exam reference
     chief_exam_transcripts: dict[int, list[str]] = {}
     dw_chief_exam_transcripts: dict[int, list[str]] = {}
+    # Running summary of transcript lines folded out of the lists above
+    chief_exam_summaries: dict[int, str] = {}
+    dw_chief_exam_summaries: dict[int, str] = {}
+    # Questions put in cross-examination, by witness agent key ("pw_0", "dw_1", ...)
+    cross_exam_questions: dict[str, list[str]] = {}
@@ -4,9 +4,9 @@ Extracts structured data from PDF text using LLM
 """
 
 import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from typing import Optional
 from langchain_core.messages import SystemMessage, HumanMessage
-from langchain_core.output_parsers import PydanticOutputParser
 from langchain_openai import ChatOpenAI
 from langchain_anthropic import ChatAnthropic
 from langchain_text_splitters import RecursiveCharacterTextSplitter
@@ -20,6 +20,46 @@ from schemas import (
 )
 
 
+# Section extractions run concurrently; each is an independent LLM round-trip
+EXTRACTION_WORKERS = 8
+
+# Most section requests extract_cases keeps in flight at once across all documents
+BATCH_MAX_CONCURRENCY = 32
+
+# (result key, section name used in the prompt, schema) for each of the 15 sections
+EXTRACTION_SECTIONS = [
+    ("Case Metadata", "Case Metadata", CaseMetadata),
+    ("Party Details", "Party Details", PartyDetails),
+    ("Legal Representation", "Legal Representation", LegalRepresentation),
+    ("Factual Matrix", "Factual Matrix", FactualMatrix),
+    ("Procedural History", "Procedural History", ProceduralHistory),
+    ("Issues Framed", "Issues Framed", IssuesFramed),
+    ("Evidence Details", "Evidence Details", EvidenceDetails),
+    ("Medical Evidence", "Medical Evidence", MedicalEvidence),
+    ("Income Proof", "Income Proof", IncomeProof),
+    ("Compensation", "Compensation Computation", CompensationComputation),
+    ("Case Law", "Case Law Citations", CaseLawCitations),
+    ("Judicial Findings", "Judicial Findings", JudicialFindings),
+    ("Final Order", "Final Order", FinalOrder),
+    ("Post-Judgment Directions", "Post-Judgment Directions", PostJudgmentDirections),
+    ("Machine Metadata", "Machine Metadata", MachineMetadata),
+]
+
+# Identical for every section, so each extraction call for a document opens
+# with the same system prompt and document text; only the closing request
+# differs. Providers cache that shared prefix across the section calls.
+EXTRACTION_SYSTEM_PROMPT = """You are an expert legal document analyst specializing in Indian court judgments.
+Your task is to extract the requested section of information from the provided court document text.
+
+IMPORTANT INSTRUCTIONS:
+1. Extract ONLY information that is explicitly stated in the document
+2. Use null/None for fields where information is not available
+3. Be precise with dates, names, and numbers
+4. For legal citations, include the full citation if available
+5. Maintain the exact terminology used in the document
+"""
+
+
 class CourtCaseExtractor:
     """
     LangChain-based extraction pipeline for court case documents.
@@ -58,50 +98,48 @@ class CourtCaseExtractor:
         else:
             raise ValueError(f"Unsupported provider: {provider}")
 
+        # The schema travels as a tool / JSON-schema binding rather than as
+        # prompt text, so replies arrive already validated
+        self._structured_llms = {
+            schema_class: self.llm.with_structured_output(schema_class)
+            for _, _, schema_class in EXTRACTION_SECTIONS
+        }
+
         self.text_splitter = RecursiveCharacterTextSplitter(
             chunk_size=8000,
             chunk_overlap=500,
             separators=["\n\n", "\n", ". ", " ", ""]
         )
 
-    def _create_extraction_chain(self, section_name: str, schema_class, document_text: str):
-        """Create extraction chain for a specific section."""
-        parser = PydanticOutputParser(pydantic_object=schema_class)
-        format_instructions = parser.get_format_instructions()
-
-        system_content = f"""You are an expert legal document analyst specializing in Indian court judgments.
-Your task is to extract the {section_name} information from the provided court document text.
-
-IMPORTANT INSTRUCTIONS:
-1. Extract ONLY information that is explicitly stated in the document
-2. Use null/None for fields where information is not available
-3. Be precise with dates, names, and numbers
-4. For legal citations, include the full citation if available
-5. Maintain the exact terminology used in the document
-
-{format_instructions}
-"""
-
-        human_content = f"""Extract the {section_name} from the following court document text:
-
----DOCUMENT TEXT---
+    def _create_extraction_chain(self, section_name: str, document_text: str):
+        """Create extraction messages for a specific section."""
+        document_block = f"""---DOCUMENT TEXT---
 {document_text}
----END DOCUMENT---
+---END DOCUMENT---"""
 
-Provide the extracted information in the required JSON format."""
+        section_request = f"Extract the {section_name} information from the court document text above."
+
+        if self.provider == "anthropic":
+            # Anthropic caches only up to an explicit breakpoint
+            human_content = [
+                {"type": "text", "text": document_block, "cache_control": {"type": "ephemeral"}},
+                {"type": "text", "text": section_request},
+            ]
+        else:
+            # OpenAI caches matching prompt prefixes automatically
+            human_content = f"{document_block}\n\n{section_request}"
 
         messages = [
-            SystemMessage(content=system_content),
+            SystemMessage(content=EXTRACTION_SYSTEM_PROMPT),
             HumanMessage(content=human_content)
         ]
 
-        return messages, parser
+        return messages
 
     def _extract_section(self, section_name: str, schema_class, text: str):
         """Generic extraction method for any section."""
-        messages, parser = self._create_extraction_chain(section_name, schema_class, text)
-        response = self.llm.invoke(messages)
-        return parser.parse(response.content)
+        messages = self._create_extraction_chain(section_name, text)
+        return self._structured_llms[schema_class].invoke(messages)
 
     def extract_case_metadata(self, text: str) -> CaseMetadata:
         """Extract case metadata (Section 1)."""
@@ -172,44 +210,91 @@ Provide the extracted information in the required JSON format."""
 
         Args:
             text: Full document text
-            progress_callback: Optional callback function(section_name, progress_pct)
+            progress_callback: Optional callback function(section_name, progress_pct),
+                called from this thread as each section finishes
 
         Returns:
             CourtCase: Complete extracted case data
         """
-        sections = [
-            ("Case Metadata", self.extract_case_metadata),
-            ("Party Details", self.extract_party_details),
-            ("Legal Representation", self.extract_legal_representation),
-            ("Factual Matrix", self.extract_factual_matrix),
-            ("Procedural History", self.extract_procedural_history),
-            ("Issues Framed", self.extract_issues_framed),
-            ("Evidence Details", self.extract_evidence_details),
-            ("Medical Evidence", self.extract_medical_evidence),
-            ("Income Proof", self.extract_income_proof),
-            ("Compensation", self.extract_compensation),
-            ("Case Law", self.extract_case_law),
-            ("Judicial Findings", self.extract_judicial_findings),
-            ("Final Order", self.extract_final_order),
-            ("Post-Judgment Directions", self.extract_post_judgment),
-            ("Machine Metadata", self.extract_machine_metadata),
-        ]
-
-        results = {}
-        for idx, (section_name, extractor_fn) in enumerate(sections):
-            if progress_callback:
-                progress_callback(section_name, (idx / len(sections)) * 100)
-
+        def run(section):
+            key, section_name, schema_class = section
             try:
-                results[section_name] = extractor_fn(text)
+                return self._extract_section(section_name, schema_class, text)
             except Exception as e:
-                print(f"Warning: Failed to extract {section_name}: {e}")
-                results[section_name] = None
+                print(f"Warning: Failed to extract {key}: {e}")
+                return None
+
+        # The first call puts the document prefix in the provider's prompt
+        # cache; the remaining sections then run concurrently and reuse it
+        first = EXTRACTION_SECTIONS[0]
+        results = {first[0]: run(first)}
+        if progress_callback:
+            progress_callback(first[0], (1 / len(EXTRACTION_SECTIONS)) * 100)
+
+        with ThreadPoolExecutor(max_workers=EXTRACTION_WORKERS) as pool:
+            futures = {pool.submit(run, section): section[0] for section in EXTRACTION_SECTIONS[1:]}
+            for future in as_completed(futures):
+                key = futures[future]
+                results[key] = future.result()
+                if progress_callback:
+                    progress_callback(key, (len(results) / len(EXTRACTION_SECTIONS)) * 100)
 
         if progress_callback:
             progress_callback("Complete", 100)
 
-        # Construct the full CourtCase object
+        return self._assemble_case(results)
+
+    def extract_cases(self, documents: list[tuple[str, str]]) -> list[Optional[CourtCase]]:
+        """
+        Extract complete court cases from several documents at once.
+
+        Every section of every document goes through one pool, so at most
+        BATCH_MAX_CONCURRENCY requests are in flight in total.
+
+        Args:
+            documents: List of (document_id, text) tuples
+
+        Returns:
+            One CourtCase per document, or None where assembly failed
+        """
+        jobs = [
+            (self._structured_llms[schema_class], self._create_extraction_chain(section_name, text))
+            for _, text in documents
+            for _, section_name, schema_class in EXTRACTION_SECTIONS
+        ]
+
+        def run(job):
+            structured_llm, messages = job
+            try:
+                return structured_llm.invoke(messages)
+            except Exception as e:
+                return e
+
+        # Each section has its own schema binding, so they cannot share one
+        # llm.batch call
+        with ThreadPoolExecutor(max_workers=BATCH_MAX_CONCURRENCY) as pool:
+            responses = list(pool.map(run, jobs))
+
+        results = []
+        per_doc = len(EXTRACTION_SECTIONS)
+        for doc_idx, (doc_id, _) in enumerate(documents):
+            sections = {}
+            for sec_idx, (key, section_name, _) in enumerate(EXTRACTION_SECTIONS):
+                response = responses[doc_idx * per_doc + sec_idx]
+                if isinstance(response, Exception):
+                    print(f"Warning: Failed to extract {section_name} for {doc_id}: {response}")
+                    response = None
+                sections[key] = response
+            try:
+                results.append(self._assemble_case(sections))
+            except Exception as e:
+                print(f"Failed to extract {doc_id}: {e}")
+                results.append(None)
+        return results
+
+    @staticmethod
+    def _assemble_case(results: dict) -> CourtCase:
+        """Construct the full CourtCase object, with defaults for sections that failed."""
         return CourtCase(
             case_metadata=results.get("Case Metadata") or CaseMetadata(
                 case_title="Unknown",
@@ -249,37 +334,71 @@ class BatchExtractor:
         Returns:
             List of CourtCase objects
         """
-        results = []
-        for doc_id, text in documents:
-            try:
-                case = self.extractor.extract_full_case(text)
-                results.append(case)
-            except Exception as e:
-                print(f"Failed to extract {doc_id}: {e}")
-                results.append(None)
-        return results
+        return self.extractor.extract_cases(documents)
 
 
 # Utility functions for PDF processing
+
+# PDF files with at least this many pages have their pages parsed across
+# processes; below it, starting the workers costs more than the parsing
+PARALLEL_PDF_MIN_PAGES = 100
+PDF_WORKERS = os.cpu_count() or 1
+# Pages per task handed to a worker process
+PDF_PAGES_PER_TASK = 25
+
+# The document a PDF worker process opened in _init_pdf_worker
+_worker_pdf = None
+
+
+def _page_texts(pdf, start: int, stop: int) -> list[str]:
+    # PDFium ends lines with \r\n
+    return [
+        pdf[i].get_textpage().get_text_range().replace("\r\n", "\n")
+        for i in range(start, min(stop, len(pdf)))
+    ]
+
+
+def _init_pdf_worker(path: str):
+    """Open the PDF once per worker process; PDFium documents cannot be shared between processes."""
+    import pypdfium2 as pdfium
+
+    global _worker_pdf
+    _worker_pdf = pdfium.PdfDocument(path)
+
+
+def _worker_page_texts(start: int) -> list[str]:
+    return _page_texts(_worker_pdf, start, start + PDF_PAGES_PER_TASK)
+
+
+def _pdf_page_texts(source) -> list[str]:
+    """Text of each page of a PDF given as a path or bytes, parsed by PDFium.
+
+    Long PDF files are split across worker processes. Each worker opens the
+    file itself and is sent only page offsets. PDFs given as bytes (uploads)
+    are always parsed in this process, so they are not copied to workers.
+    """
+    import pypdfium2 as pdfium
+
+    pdf = pdfium.PdfDocument(source)
+    try:
+        n_pages = len(pdf)
+        if isinstance(source, bytes) or n_pages < PARALLEL_PDF_MIN_PAGES or PDF_WORKERS < 2:
+            return _page_texts(pdf, 0, n_pages)
+    finally:
+        pdf.close()
+
+    with ProcessPoolExecutor(
+        max_workers=PDF_WORKERS, initializer=_init_pdf_worker, initargs=(source,)
+    ) as pool:
+        chunks = pool.map(_worker_page_texts, range(0, n_pages, PDF_PAGES_PER_TASK))
+        return [page_text for chunk in chunks for page_text in chunk]
+
+
 def extract_text_from_pdf(pdf_path: str) -> str:
     """Extract text from PDF file."""
-    import PyPDF2
-
-    with open(pdf_path, 'rb') as file:
-        reader = PyPDF2.PdfReader(file)
-        text = ""
-        for page in reader.pages:
-            text += page.extract_text() + "\n"
-    return text
+    return "".join(page_text + "\n" for page_text in _pdf_page_texts(pdf_path))
 
 
 def extract_text_from_pdf_bytes(pdf_bytes: bytes) -> str:
     """Extract text from PDF bytes."""
-    import PyPDF2
-    from io import BytesIO
-
-    reader = PyPDF2.PdfReader(BytesIO(pdf_bytes))
-    text = ""
-    for page in reader.pages:
-        text += page.extract_text() + "\n"
-    return text
+    return "".join(page_text + "\n" for page_text in _pdf_page_texts(pdf_bytes))